@@ -1,21 +1,44 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import csv
+import hashlib
+import json
 import re
 import unicodedata
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 import pdfplumber
-import pandas as pd
+import pypdfium2 as pdfium
+import numpy as np
 import glob
+from collections import deque
 from urllib.parse import urlparse
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# Optional faster HTML parsers for the crawler (BeautifulSoup + html.parser otherwise)
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
 
 # --- CONFIGURATION ---
 URL_PROJETS = "https://coeurdumaroc.ma/fr/projects"
 SCRIPT_DIR = Path(__file__).resolve().parent
 DOSSIER_CIBLE = SCRIPT_DIR / "banque_projets_bk"
+# ETag / Last-Modified + local size/mtime per PDF URL, for skipping/conditional re-downloads
+HTTP_CACHE_FILE = DOSSIER_CIBLE / ".http_cache.json"
+# False: a PDF whose local size/mtime match the cache is reused without any request.
+# True: always revalidate with the server (conditional GET) to pick up updated PDFs.
+REVALIDATE_DOWNLOADS = False
 OUTPUT_CSV = SCRIPT_DIR / "output_projects.csv"
 CURRENCY = "MAD"
 LANGUAGE = "FR"
@@ -26,35 +49,152 @@ INV_LOW_MAX = 5_000_000
 INV_MEDIUM_MAX = 20_000_000
 ROI_ASSUMPTION_YEARS = 6
 MAX_WORKERS = max(1, min((os.cpu_count() or 2), 6))
+# Concurrent HTTP requests while crawling the project listing
+CRAWL_WORKERS = 8
+# Concurrent PDF downloads (threads sharing one pooled session)
+DOWNLOAD_WORKERS = 8
+# Below this many chars on page 1, a PDF is treated as image-only (scanned) and skipped
+MIN_TEXT_CHARS = 20
+# Extracted PDF text, keyed by a hash of the PDF bytes (unchanged PDFs are not re-parsed)
+CACHE_DIR = SCRIPT_DIR / ".cache"
+LAYOUT_CACHE_VERSION = 3  # bump when extract_text_with_layout changes
+
+# ---------------------------------------------------------------------------
+# Precompiled regex patterns (compiled once at import, flags baked in)
+# ---------------------------------------------------------------------------
+_RE_WS = re.compile(r"\s+")
+_RE_COMBINING_MARKS = re.compile(r"[\u0300-\u036f]+")
+_RE_NON_REF_CHARS = re.compile(r"[^\w\s\-]")
+_RE_LABEL_PREFIX = re.compile(r"^(?:Secteur\s*économique|Filières\s*de\s*production)\s*:\s*", re.IGNORECASE)
+
+# Industrial zones
+_ZONE_STOP = r"(?:Future|ZI|ZAE|Sup|Lieu|PROGRAMME|CAPACIT[ÉE]|EMPLOIS|TRI|PBP|CA|Cha[iî]nes?|Mat[ée]riel|Equipements?|Emballages?|BESOINS|Web|Contact)"
+_RE_ZONE_PATTERNS = [
+    re.compile(rf"(?:Agro-?p[oô]le|Agropole)\s+[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{{0,40}}?(?=\b{_ZONE_STOP}\b|[;\n]|$)", re.IGNORECASE),
+    re.compile(rf"Future\s+ZI\s+[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{{0,40}}?(?=\b{_ZONE_STOP}\b|[;\n]|$)", re.IGNORECASE),
+    re.compile(rf"\bZAE\s+[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{{0,40}}?(?=\b{_ZONE_STOP}\b|[;\n]|$)", re.IGNORECASE),
+    re.compile(rf"\bZI\s+[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{{0,40}}?(?=\b{_ZONE_STOP}\b|[;\n]|$)", re.IGNORECASE),
+]
+_RE_ZONE_DASH = re.compile(r"\s[-–—]\s")
+_RE_ZONE_TRAILING_STOP = re.compile(rf"\b({_ZONE_STOP})\b.*$", re.IGNORECASE)
+
+# Province
+_KNOWN_PROVINCES = ["Béni Mellal", "Azilal", "Fquih Ben Salah", "Khénifra", "Khouribga"]
+# One group per province: m.lastindex - 1 is its priority in _KNOWN_PROVINCES (no lookup on
+# the matched text, which IGNORECASE lets differ from the canonical name, e.g. "ı" or "ſ")
+_RE_PROVINCE = re.compile(
+    r"\b(?:" + "|".join(f"({re.escape(p)})" for p in _KNOWN_PROVINCES) + r")\b", re.IGNORECASE
+)
+_RE_LIEU = re.compile(
+    r"Lieu\s*:\s*(.+?)(?=\b(?:Future|ZAE|ZI|Sup|PROGRAMME|CAPACIT[ÉE]|EMPLOIS|TRI|PBP|INVESTISSEMENT|BESOINS|Web|Contact)\b|\n|$)",
+    re.IGNORECASE,
+)
+_RE_LOC_SPLIT = re.compile(r"\s*[;–—-]\s*")
+_RE_DIGIT_OR_PERCENT = re.compile(r"[\d%]")
+
+# Title / sector / sub-sector / description
+_RE_TITLE = re.compile(r"Projet\s*N°\s*:\s*(?:PR\d+)?\s*\n(.+?)(?=\n|Secteur)", re.IGNORECASE | re.DOTALL)
+_RE_SECTOR_LEFT = re.compile(r"Secteur\s*économique\s*:\s*(.+?)(?=Filières|ACTIVITÉ|AnalySe|$)", re.IGNORECASE | re.DOTALL)
+_RE_SECTOR_FULL = re.compile(r"Secteur\s*économique\s*:\s*(.+?)(?=Filières|ACTIVITÉ|AnalySe)", re.IGNORECASE | re.DOTALL)
+_RE_SUB_SECTOR_RIGHT = re.compile(r"Filières\s*de\s*production\s*:\s*(.+?)(?=Secteur|ACTIVITÉ|AnalySe|$)", re.IGNORECASE | re.DOTALL)
+_RE_SUB_SECTOR_FULL = re.compile(r"Filières\s*de\s*production\s*:\s*(.+?)(?=Secteur|ACTIVITÉ|AnalySe)", re.IGNORECASE | re.DOTALL)
+_DESC_STOP = r"(?:\n\s*(?:Code\s*(?:HS|SH)|PRODUIT\s+PRINCIPAL|D[ÉE]BOUCH[ÉE]S|SUPERFICIE|PROGRAMME|CAPACIT[ÉE]|EMPLOIS|TRI|PBP|INVESTISSEMENT|BESOINS|Sup\s*:|Lieu\s*:|Web\s*:|Contact\s*:))"
+_RE_DESC_KEY = re.compile(rf"(?:ACTIVIT[ÉE]\s*-\s*)?DESCRIPTION\s*DU\s*PROJET\s*(.+?)(?={_DESC_STOP}|$)", re.IGNORECASE | re.DOTALL)
+_RE_DESC_NARRATIVE = re.compile(rf"(?:^|\n)\s*(?:Un|Une|Le|La|L['’])\s+(.+?)(?={_DESC_STOP}|$)", re.IGNORECASE | re.DOTALL)
+
+# Numeric text normalization: bullets/NBSP/replacement char/dash variants (one translate pass),
+# then spaced-letter keywords, OCR confusions and whitespace (one regex pass).
+_NORM_TRANS = str.maketrans({
+    "\u00a0": " ",
+    "\uf0fc": " ",
+    "\u2022": " ",
+    "\ufffd": "-",
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u2212": "-",
+})
+_BULLET_TRANS = str.maketrans({"\uf0fc": " ", "\u2022": " "})
+# Amount cleanup: drop thousands separators, decimal comma -> dot
+_AMOUNT_TRANS = str.maketrans({" ": None, "\u00a0": None, ",": "."})
+_RE_NORM_TOKENS = re.compile(
+    r"(?P<mdh>\bM\s*D\s*H(?:\s*S)?\b)"
+    r"|(?P<kdhs>\bK\s*D\s*H\s*S\b)"  # thousand dirhams ("K D H S")
+    r"|(?P<pbp>\bP\s*B\s*(?:0\s*)?P\b)"  # includes OCR-like confusion PB0P
+    r"|(?P<tri>\bT\s*R\s*I\b)"
+    r"|(?P<ca>\bC\s*A\b)"
+    r"|(?P<dhs>\bD\s*H\s*S\b)"
+    r"|(?P<dh>\bD\s*H\b)"
+    r"|(?P<ws>\s+)",
+    re.IGNORECASE,
+)
+_NORM_TOKEN_REPLACEMENTS = {
+    "kdhs": "KDHS",
+    "pbp": "PBP",
+    "tri": "TRI",
+    "ca": "CA",
+    "dhs": "DHS",
+    "dh": "DH",
+    "ws": " ",
+}
+
+# Numeric fields
+# Unit/label markers, checked as plain substrings of the case-folded text.
+# Every field regex below contains its marker literally, so a missing marker means no match.
+_NUMERIC_MARKERS = ("kdh", "mdh", "dh", "sup", "tri", "pbp", "roi")
+_RE_INV_MDH_RANGE = re.compile(
+    r"(\d+(?:[.,]\d+)?)\s*(?:-|à)\s*(\d+(?:[.,]\d+)?)\s*(?:Mns?|Mn)?\s*MDH(?:S)?\b",
+    re.IGNORECASE,
+)
+_RE_INV_MDH_LABELED = re.compile(
+    r"(?:INVESTISSEMENT|D['’]INVESTISSEMENT)\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*(?:Mns?|Mn)?\s*MDH(?:S)?\b",
+    re.IGNORECASE,
+)
+_RE_INV_MDH_SINGLE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(?:Mns?|Mn)?\s*MDH(?:S)?\b", re.IGNORECASE)
+_RE_INV_KDHS_RANGE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(?:-|à)\s*(\d+(?:[.,]\d+)?)\s*KDHS?\b", re.IGNORECASE)
+_RE_INV_KDHS_SINGLE = re.compile(r"\b(\d+(?:[.,]\d+)?)\s*KDHS?\b", re.IGNORECASE)
+_RE_INV_DH_BEFORE_CA = re.compile(r"-\s*([\d\s.,]+)\s*DHS?\s*-\s*CA\b", re.IGNORECASE)
+_RE_INV_DH_LABELED = re.compile(r"(?:INVESTISSEMENT|D['’]INVESTISSEMENT)\b.*?([\d\s.,]+)\s*DHS?\b", re.IGNORECASE)
+_RE_INV_DH_STANDALONE = re.compile(r"\b([\d\s.,]{3,})\s*DHS?\b", re.IGNORECASE)
+_RE_SURF_RANGE = re.compile(
+    r"Sup\s*[:\-]?\s*(\d+(?:[\s.,]\d+)?)(?:\s*m\s*[²2])?\s*(?:-|à)\s*(\d+(?:[\s.,]\d+)?)(?:\s*m\s*[²2])?\b",
+    re.IGNORECASE,
+)
+_RE_SURF_SINGLE = re.compile(r"Sup\s*[:\-]?\s*(\d+(?:[\s.,]\d+)?)\s*m\s*[²2]\b", re.IGNORECASE)
+_RE_SURF_HA = re.compile(r"Sup\s*[:\-]?\s*(\d+(?:[.,]\d+)?)(?:\s*(?:-|à)\s*(\d+(?:[.,]\d+)?))?\s*Ha\b", re.IGNORECASE)
+_RE_TRI_RANGE = re.compile(r"TRI\s*(?:moyen)?\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*(?:-|à)\s*(\d+(?:[.,]\d+)?)\s*%?", re.IGNORECASE)
+_RE_TRI_SINGLE = re.compile(r"TRI\s*(?:moyen)?\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*%?", re.IGNORECASE)
+_RE_PBP = re.compile(r"PBP\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*(?:-|à)?\s*(\d+(?:[.,]\d+)?)?\s*ans", re.IGNORECASE)
+_RE_ROI_YEARS = re.compile(r"\bROI\b\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*(?:-|à)?\s*(\d+(?:[.,]\d+)?)?\s*ans", re.IGNORECASE)
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=None)
 def _remove_accents(s: str) -> str:
     """Remove accents deterministically (NFD and strip combining marks)."""
     if not s:
         return ""
-    nfd = unicodedata.normalize("NFD", s)
-    return "".join(c for c in nfd if unicodedata.category(c) != "Mn")
+    return _RE_COMBINING_MARKS.sub("", unicodedata.normalize("NFD", s))
 
+@lru_cache(maxsize=4096)
 def normalize_for_reference(s: str) -> str:
     """Uppercase, replace spaces with hyphens, remove accents. For project_reference."""
     if not s or not s.strip():
         return ""
     s = _remove_accents(s.strip())
-    s = re.sub(r"[^\w\s\-]", "", s)
-    s = re.sub(r"\s+", "-", s).strip("-")
+    s = _RE_NON_REF_CHARS.sub("", s)
+    s = _RE_WS.sub("-", s).strip("-")
     return s.upper()
 
 def clean_text(text: str) -> str:
     """Clean extra spaces and newlines."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text).strip()
+    return _RE_WS.sub(" ", text).strip()
 
 def _strip_label_prefix(s: str) -> str:
     s = clean_text(s)
-    s = re.sub(r"^(?:Secteur\s*économique|Filières\s*de\s*production)\s*:\s*", "", s, flags=re.IGNORECASE)
+    s = _RE_LABEL_PREFIX.sub("", s)
     return s.strip()
 
 def _dedupe_repeated_title(title: str) -> str:
@@ -80,15 +220,7 @@ def extract_industrial_zone(text: str) -> str | None:
     if not text:
         return None
 
-    t = text.replace("", " ").replace("\u2022", " ")
-    stop = r"(?:Future|ZI|ZAE|Sup|Lieu|PROGRAMME|CAPACIT[ÉE]|EMPLOIS|TRI|PBP|CA|Cha[iî]nes?|Mat[ée]riel|Equipements?|Emballages?|BESOINS|Web|Contact)"
-
-    patterns = [
-        rf"(?:Agro-?p[oô]le|Agropole)\s+[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{{0,40}}?(?=\b{stop}\b|[;\n]|$)",
-        rf"Future\s+ZI\s+[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{{0,40}}?(?=\b{stop}\b|[;\n]|$)",
-        rf"\bZAE\s+[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{{0,40}}?(?=\b{stop}\b|[;\n]|$)",
-        rf"\bZI\s+[A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s\-]{{0,40}}?(?=\b{stop}\b|[;\n]|$)",
-    ]
+    t = text.translate(_BULLET_TRANS)
 
     def _trim_zone(z: str) -> str:
         z = clean_text(z).strip(" -–—.,;:/\\")
@@ -96,9 +228,9 @@ def extract_industrial_zone(text: str) -> str | None:
             return z
 
         # If a dash is used as part of the zone name, keep it (common in "Future ZI ... - ...")
-        if re.search(r"\s[-–—]\s", z):
+        if _RE_ZONE_DASH.search(z):
             # Still trim any trailing noise after a repeated zone marker
-            z = re.sub(rf"\b({stop})\b.*$", "", z, flags=re.IGNORECASE).strip(" -–—.,;:/\\")
+            z = _RE_ZONE_TRAILING_STOP.sub("", z).strip(" -–—.,;:/\\")
             return z
 
         tokens = z.split()
@@ -120,8 +252,8 @@ def extract_industrial_zone(text: str) -> str | None:
         return z
 
     zones: list[str] = []
-    for pat in patterns:
-        for m in re.finditer(pat, t, flags=re.IGNORECASE):
+    for pat in _RE_ZONE_PATTERNS:
+        for m in pat.finditer(t):
             z = _trim_zone(m.group(0))
             if z and z not in zones:
                 zones.append(z)
@@ -138,92 +270,183 @@ def extract_province(text: str) -> str | None:
     if not text:
         return None
 
-    known_provinces = ["Béni Mellal", "Azilal", "Fquih Ben Salah", "Khénifra", "Khouribga"]
-    for p in known_provinces:
-        if re.search(rf"\b{re.escape(p)}\b", text, re.IGNORECASE):
-            return p
+    # One scan for all provinces; keep the list priority when several are mentioned
+    found = [m.lastindex for m in _RE_PROVINCE.finditer(text)]
+    if found:
+        return _KNOWN_PROVINCES[min(found) - 1]
 
-    m_loc = re.search(
-        r"Lieu\s*:\s*(.+?)(?=\b(?:Future|ZAE|ZI|Sup|PROGRAMME|CAPACIT[ÉE]|EMPLOIS|TRI|PBP|INVESTISSEMENT|BESOINS|Web|Contact)\b|\n|$)",
-        text,
-        re.IGNORECASE,
-    )
+    m_loc = _RE_LIEU.search(text)
     if not m_loc:
         return None
 
     loc_text = clean_text(m_loc.group(1))
     # Keep first chunk only (before dash/semicolon)
-    loc_text = re.split(r"\s*[;–—-]\s*", loc_text)[0].strip()
+    loc_text = _RE_LOC_SPLIT.split(loc_text)[0].strip()
 
     # If too noisy/long, discard
-    if len(loc_text) > 40 or re.search(r"[\d%]", loc_text):
+    if len(loc_text) > 40 or _RE_DIGIT_OR_PERCENT.search(loc_text):
         return None
 
     return loc_text or None
 
-def get_next_project_id(csv_path: Path) -> int:
-    """Read CSV to find the max project_id and return max + 1."""
-    if not csv_path.exists():
-        return 1
-    try:
-        df = pd.read_csv(csv_path)
-        if "project_id" in df.columns and not df.empty:
-            return df["project_id"].max() + 1
-    except Exception:
-        pass
-    return 1
-
-# ---------------------------------------------------------------------------
-# Extraction Logic
-# ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
 # Extraction Logic
 # ---------------------------------------------------------------------------
+def _join_parts(parts: list[str]) -> str:
+    return "\n".join([p for p in parts if p]).strip()
+
+
+def _to_float(s: str) -> float:
+    return float(s.replace(",", "."))
+
+
+def _range_mean(low: str, high: str | None) -> float:
+    """Value of "A" or midpoint of "A - B" (decimal comma accepted)."""
+    a = _to_float(low)
+    if high:
+        return (a + _to_float(high)) / 2
+    return a
+
+
+def _derive_roi_payback(roi: float | None, payback: float | None) -> tuple[float | None, float | None]:
+    """Fill whichever of ROI (%) / payback (years) is missing from the other: ROI = 100 / payback."""
+    if roi is None and payback is not None:
+        if payback > 0:
+            roi = round(100.0 / payback, 2)
+    elif payback is None and roi is not None:
+        if 0 < roi <= 100:
+            payback = round(100.0 / roi, 2)
+    return roi, payback
+
+
+def _extract_text_with_layout_pdfplumber(pdf_path: Path) -> dict:
+    """Fallback extraction (pdfplumber) when pdfium returns no text."""
+    result = {"full_text": "", "left_text": "", "right_text": ""}
+
+    with pdfplumber.open(pdf_path) as pdf:
+        if not pdf.pages:
+            return result
+
+        # Some BK PDFs have key numeric blocks on page 2.
+        max_pages = min(2, len(pdf.pages))
+        full_parts: list[str] = []
+        left_parts: list[str] = []
+        right_parts: list[str] = []
+
+        for page in pdf.pages[:max_pages]:
+            width = page.width
+            mid_point = width / 2
+
+            full_parts.append(page.extract_text() or "")
+
+            try:
+                left_crop = page.crop((0, 0, mid_point, page.height))
+                left_parts.append(left_crop.extract_text() or "")
+            except Exception:
+                pass
+
+            try:
+                right_crop = page.crop((mid_point, 0, width, page.height))
+                right_parts.append(right_crop.extract_text() or "")
+            except Exception:
+                pass
+
+        result["full_text"] = _join_parts(full_parts)
+        result["left_text"] = _join_parts(left_parts)
+        result["right_text"] = _join_parts(right_parts)
+
+    return result
+
+
 def extract_text_with_layout(pdf_path: Path) -> dict:
     """
     Extract text using layout analysis to separate Left and Right columns.
     Returns a dict with 'full_text', 'left_text', 'right_text'.
+    Uses pypdfium2 (native PDFium); falls back to pdfplumber if no text is found.
     """
     result = {"full_text": "", "left_text": "", "right_text": ""}
-    
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if not pdf.pages:
-                return result
 
+    try:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
             # Some BK PDFs have key numeric blocks on page 2.
-            max_pages = min(2, len(pdf.pages))
+            max_pages = min(2, len(pdf))
             full_parts: list[str] = []
             left_parts: list[str] = []
             right_parts: list[str] = []
 
-            for page in pdf.pages[:max_pages]:
-                width = page.width
-                mid_point = width / 2
-
-                full_parts.append(page.extract_text() or "")
-
+            for i in range(max_pages):
+                page = pdf[i]
+                textpage = page.get_textpage()
                 try:
-                    left_crop = page.crop((0, 0, mid_point, page.height))
-                    left_parts.append(left_crop.extract_text() or "")
-                except Exception:
-                    pass
+                    # Image-only (scanned) PDF: no text layer on page 1, skip the rest of the parse.
+                    if i == 0 and textpage.count_chars() < MIN_TEXT_CHARS:
+                        print(f"Skip (no text layer): {pdf_path}")
+                        return result
+
+                    width = page.get_width()
+                    height = page.get_height()
+                    mid_point = width / 2
+
+                    # PDFium uses bottom-left origin: (left, bottom, right, top)
+                    full_parts.append(textpage.get_text_range() or "")
+                    left_parts.append(textpage.get_text_bounded(0, 0, mid_point, height) or "")
+                    right_parts.append(textpage.get_text_bounded(mid_point, 0, width, height) or "")
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+
+        # PDFium separates lines with CRLF; the regex rules expect "\n".
+        result["full_text"] = _join_parts(full_parts).replace("\r\n", "\n")
+        result["left_text"] = _join_parts(left_parts).replace("\r\n", "\n")
+        result["right_text"] = _join_parts(right_parts).replace("\r\n", "\n")
+    except Exception as e:
+        print(f"Error reading {pdf_path} (pdfium): {e}")
 
-                try:
-                    right_crop = page.crop((mid_point, 0, width, page.height))
-                    right_parts.append(right_crop.extract_text() or "")
-                except Exception:
-                    pass
-
-            result["full_text"] = "\n".join([p for p in full_parts if p]).strip()
-            result["left_text"] = "\n".join([p for p in left_parts if p]).strip()
-            result["right_text"] = "\n".join([p for p in right_parts if p]).strip()
-                
+    if result["full_text"]:
+        return result
+
+    try:
+        return _extract_text_with_layout_pdfplumber(pdf_path)
     except Exception as e:
         print(f"Error reading {pdf_path}: {e}")
-        
+
     return result
 
+def _file_digest(path: Path) -> str:
+    """Content hash of a file (BLAKE2b, stdlib)."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def extract_text_with_layout_cached(pdf_path: Path) -> dict:
+    """extract_text_with_layout, reusing the result stored in CACHE_DIR for a PDF with the same content."""
+    cache_path = CACHE_DIR / f"bk-layout-v{LAYOUT_CACHE_VERSION}-{_file_digest(pdf_path)}.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    result = extract_text_with_layout(pdf_path)
+    if not result["full_text"]:
+        return result  # unreadable / image-only: not worth caching, may be a transient error
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: cannot write {cache_path}: {e}")
+    return result
+
+
 def extract_project_title(text: str, filename: str) -> str:
     # "Projet N° : PR100" ... "CENTRE D’APPEL"
     # Title seems to be on the second line or after Project N°
@@ -239,7 +462,7 @@ def extract_project_title(text: str, filename: str) -> str:
                     return _dedupe_repeated_title(candidate)
     
     # Strategy 2: Regex fallback
-    m_title = re.search(r"Projet\s*N°\s*:\s*(?:PR\d+)?\s*\n(.+?)(?=\n|Secteur)", text, re.IGNORECASE | re.DOTALL)
+    m_title = _RE_TITLE.search(text)
     if m_title:
         return _dedupe_repeated_title(m_title.group(1))
 
@@ -251,12 +474,12 @@ def extract_sector_from_layout(left_text: str, full_text: str) -> str:
     # It might be separate from "Filières" now.
     
     # Try Left Text first
-    m_sector = re.search(r"Secteur\s*économique\s*:\s*(.+?)(?=Filières|ACTIVITÉ|AnalySe|$)", left_text, re.IGNORECASE | re.DOTALL)
+    m_sector = _RE_SECTOR_LEFT.search(left_text)
     if m_sector:
         return _strip_label_prefix(m_sector.group(1))
         
     # Fallback to Full Text (risk of merging)
-    m_sector_full = re.search(r"Secteur\s*économique\s*:\s*(.+?)(?=Filières|ACTIVITÉ|AnalySe)", full_text, re.IGNORECASE | re.DOTALL)
+    m_sector_full = _RE_SECTOR_FULL.search(full_text)
     if m_sector_full:
         return _strip_label_prefix(m_sector_full.group(1))
         
@@ -266,12 +489,12 @@ def extract_sub_sector_from_layout(right_text: str, full_text: str) -> str | Non
     # Sub-sector "Filières de production :" is usually on the RIGHT or next to Sector
     
     # Try Right Text first
-    m_sub = re.search(r"Filières\s*de\s*production\s*:\s*(.+?)(?=Secteur|ACTIVITÉ|AnalySe|$)", right_text, re.IGNORECASE | re.DOTALL)
+    m_sub = _RE_SUB_SECTOR_RIGHT.search(right_text)
     if m_sub:
         return _strip_label_prefix(m_sub.group(1))
         
     # Fallback Full Text
-    m_sub_full = re.search(r"Filières\s*de\s*production\s*:\s*(.+?)(?=Secteur|ACTIVITÉ|AnalySe)", full_text, re.IGNORECASE | re.DOTALL)
+    m_sub_full = _RE_SUB_SECTOR_FULL.search(full_text)
     if m_sub_full:
         return _strip_label_prefix(m_sub_full.group(1))
         
@@ -283,29 +506,31 @@ def extract_description_from_layout(left_text: str, full_text: str) -> str | Non
     - If "DESCRIPTION DU PROJET" exists, stop at next section heading.
     - Otherwise, take the first narrative paragraph and stop before headings like Code/PRODUIT/SUPERFICIE/PROGRAMME...
     """
-    stop = r"(?:\n\s*(?:Code\s*(?:HS|SH)|PRODUIT\s+PRINCIPAL|D[ÉE]BOUCH[ÉE]S|SUPERFICIE|PROGRAMME|CAPACIT[ÉE]|EMPLOIS|TRI|PBP|INVESTISSEMENT|BESOINS|Sup\s*:|Lieu\s*:|Web\s*:|Contact\s*:))"
-
-    key_pattern = rf"(?:ACTIVIT[ÉE]\s*-\s*)?DESCRIPTION\s*DU\s*PROJET\s*(.+?)(?={stop}|$)"
-    m_desc = re.search(key_pattern, left_text, re.IGNORECASE | re.DOTALL)
+    m_desc = _RE_DESC_KEY.search(left_text)
     if m_desc:
         return clean_text(m_desc.group(1))
 
-    m_desc_full = re.search(key_pattern, full_text, re.IGNORECASE | re.DOTALL)
+    m_desc_full = _RE_DESC_KEY.search(full_text)
     if m_desc_full:
         return clean_text(m_desc_full.group(1))
 
     # Fallback: first narrative paragraph
-    narrative = rf"(?:^|\n)\s*(?:Un|Une|Le|La|L['’])\s+(.+?)(?={stop}|$)"
-    m_narr = re.search(narrative, left_text, re.IGNORECASE | re.DOTALL)
+    m_narr = _RE_DESC_NARRATIVE.search(left_text)
     if m_narr:
         return clean_text(m_narr.group(0))
 
-    m_narr_full = re.search(narrative, full_text, re.IGNORECASE | re.DOTALL)
+    m_narr_full = _RE_DESC_NARRATIVE.search(full_text)
     if m_narr_full:
         return clean_text(m_narr_full.group(0))
 
     return None
 
+def _norm_token(m: re.Match) -> str:
+    """Replacement for one _RE_NORM_TOKENS match (MDH keeps its case, only spaces are removed)."""
+    if m.lastgroup == "mdh":
+        return _RE_WS.sub("", m.group(0))
+    return _NORM_TOKEN_REPLACEMENTS[m.lastgroup]
+
 def extract_numeric_fields(text: str) -> dict:
     data = {}
 
@@ -314,205 +539,132 @@ def extract_numeric_fields(text: str) -> dict:
         Normalize PDF extracted text for robust numeric regex:
         - bullets/NBSP/replacement char
         - dash variants
-        - collapse spaced-letter tokens back into keywords (MDH/MDHS/PBP/TRI/CA)
+        - collapse spaced-letter tokens back into keywords (MDH/MDHS/PBP/TRI/CA/DH/DHS/KDHS)
         """
         if not s:
             return ""
-        s = s.replace("\u00a0", " ").replace("", " ").replace("\u2022", " ")
-        s = s.replace("\ufffd", "-")
-        s = s.replace("–", "-").replace("—", "-").replace("−", "-")
-        s = re.sub(r"\bM\s*D\s*H\s*S?\b", lambda m: re.sub(r"\s+", "", m.group(0)), s, flags=re.IGNORECASE)
-        s = re.sub(r"\bP\s*B\s*P\b", "PBP", s, flags=re.IGNORECASE)
-        s = re.sub(r"\bT\s*R\s*I\b", "TRI", s, flags=re.IGNORECASE)
-        s = re.sub(r"\bC\s*A\b", "CA", s, flags=re.IGNORECASE)
-        # sometimes "D H S" appears
-        s = re.sub(r"\bD\s*H\s*S\b", "DHS", s, flags=re.IGNORECASE)
-        s = re.sub(r"\bD\s*H\b", "DH", s, flags=re.IGNORECASE)
-        # sometimes "K D H S" appears (thousand dirhams)
-        s = re.sub(r"\bK\s*D\s*H\s*S\b", "KDHS", s, flags=re.IGNORECASE)
-        # OCR-like confusion: PB0P
-        s = re.sub(r"\bP\s*B\s*0\s*P\b", "PBP", s, flags=re.IGNORECASE)
-        s = re.sub(r"\bPB0P\b", "PBP", s, flags=re.IGNORECASE)
-        s = re.sub(r"\s+", " ", s)
-        return s
+        s = s.translate(_NORM_TRANS)
+        return _RE_NORM_TOKENS.sub(_norm_token, s)
 
     t = _norm(text)
+
+    # Substring checks (no regex) to find which markers exist; each field search
+    # below only runs when its marker is present.
+    # upper().lower() folds the same characters as re.IGNORECASE (e.g. "ı", "ſ", Kelvin sign)
+    folded = t.upper().lower()
+    markers = {m for m in _NUMERIC_MARKERS if m in folded}
     
     # Investment (MDH/MDHS)
     # Pattern: 15 - 35 MDHS or 20 MDHS
     # Some PDFs add "Mn/Mns" (millions) between value and unit: "50 - 75 Mn MDHS"
-    m_inv = re.search(
-        r"(\d+(?:[.,]\d+)?)\s*(?:-|à)\s*(\d+(?:[.,]\d+)?)\s*(?:Mns?|Mn)?\s*MDH(?:S)?\b",
-        t,
-        re.IGNORECASE,
-    )
+    m_inv = _RE_INV_MDH_RANGE.search(t) if "mdh" in markers else None
     est_mad = None
 
     # Investment in KDHS (thousand dirhams)
-    m_kdhs = re.search(r"(\d+(?:[.,]\d+)?)\s*(?:-|à)\s*(\d+(?:[.,]\d+)?)\s*KDHS?\b", t, re.IGNORECASE)
+    m_kdhs = _RE_INV_KDHS_RANGE.search(t) if "kdh" in markers else None
     if m_kdhs:
         try:
-            a = float(m_kdhs.group(1).replace(",", "."))
-            b = float(m_kdhs.group(2).replace(",", "."))
-            est_mad = ((a + b) / 2) * 1000.0
+            est_mad = _range_mean(m_kdhs.group(1), m_kdhs.group(2)) * 1000.0
         except Exception:
             pass
-    else:
-        m_kdhs_single = re.search(r"\b(\d+(?:[.,]\d+)?)\s*KDHS?\b", t, re.IGNORECASE)
+    elif "kdh" in markers:
+        m_kdhs_single = _RE_INV_KDHS_SINGLE.search(t)
         if m_kdhs_single:
             try:
-                est_mad = float(m_kdhs_single.group(1).replace(",", ".")) * 1000.0
+                est_mad = _to_float(m_kdhs_single.group(1)) * 1000.0
             except Exception:
                 pass
 
     # Investment in MDH/MDHS
     if m_inv:
         try:
-            low = float(m_inv.group(1).replace(",", "."))
-            high = float(m_inv.group(2).replace(",", "."))
-            est_mad = ((low + high) / 2) * 1_000_000
+            est_mad = _range_mean(m_inv.group(1), m_inv.group(2)) * 1_000_000
         except: pass
-    else:
-        m_inv_single = re.search(
-            r"(?:INVESTISSEMENT|D['’]INVESTISSEMENT)\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*(?:Mns?|Mn)?\s*MDH(?:S)?\b",
-            t,
-            re.IGNORECASE,
-        )
+    elif "mdh" in markers:
+        m_inv_single = _RE_INV_MDH_LABELED.search(t)
         if not m_inv_single:
-            m_inv_single = re.search(r"(\d+(?:[.,]\d+)?)\s*(?:Mns?|Mn)?\s*MDH(?:S)?\b", t, re.IGNORECASE)
+            m_inv_single = _RE_INV_MDH_SINGLE.search(t)
         if m_inv_single and est_mad is None:
             try:
-                val = float(m_inv_single.group(1).replace(",", "."))
-                est_mad = val * 1_000_000
+                est_mad = _to_float(m_inv_single.group(1)) * 1_000_000
             except: pass
 
     # Investment in DH/DHS (some service projects)
-    if est_mad is None:
+    if est_mad is None and "dh" in markers:
         # Typical line: "- 150 000 DHS - CA: 200 000-250 000 DHS"
-        m_dh = re.search(r"-\s*([\d\s.,]+)\s*DHS?\s*-\s*CA\b", t, re.IGNORECASE)
+        m_dh = _RE_INV_DH_BEFORE_CA.search(t)
         if not m_dh:
-            m_dh = re.search(r"(?:INVESTISSEMENT|D['’]INVESTISSEMENT)\b.*?([\d\s.,]+)\s*DHS?\b", t, re.IGNORECASE)
+            m_dh = _RE_INV_DH_LABELED.search(t)
         if not m_dh:
             # Fallback: first standalone DHS amount
-            m_dh = re.search(r"\b([\d\s.,]{3,})\s*DHS?\b", t, re.IGNORECASE)
+            m_dh = _RE_INV_DH_STANDALONE.search(t)
         if m_dh:
             try:
-                s = m_dh.group(1)
-                s = s.replace(" ", "").replace("\u00a0", "").replace(",", ".")
-                est_mad = float(s)
+                est_mad = float(m_dh.group(1).translate(_AMOUNT_TRANS))
             except Exception:
                 pass
     data["estimated_investment_mad"] = est_mad
 
     # Surface (m2)
-    m_surf_range = re.search(
-        r"Sup\s*[:\-]?\s*(\d+(?:[\s.,]\d+)?)(?:\s*m\s*[²2])?\s*(?:-|à)\s*(\d+(?:[\s.,]\d+)?)(?:\s*m\s*[²2])?\b",
-        t,
-        re.IGNORECASE,
-    )
+    m_surf_range = _RE_SURF_RANGE.search(t) if "sup" in markers else None
     if m_surf_range:
         try:
-            s1 = float(m_surf_range.group(1).replace(" ", "").replace(",", "."))
-            s2 = float(m_surf_range.group(2).replace(" ", "").replace(",", "."))
+            s1 = float(m_surf_range.group(1).translate(_AMOUNT_TRANS))
+            s2 = float(m_surf_range.group(2).translate(_AMOUNT_TRANS))
             data["required_land_area_m2"] = (s1 + s2) / 2
         except Exception:
             pass
-    else:
-        m_surf_single = re.search(
-            r"Sup\s*[:\-]?\s*(\d+(?:[\s.,]\d+)?)\s*m\s*[²2]\b",
-            t,
-            re.IGNORECASE,
-        )
+    elif "sup" in markers:
+        m_surf_single = _RE_SURF_SINGLE.search(t)
         if m_surf_single:
             try:
-                data["required_land_area_m2"] = float(m_surf_single.group(1).replace(" ", "").replace(",", "."))
+                data["required_land_area_m2"] = float(m_surf_single.group(1).translate(_AMOUNT_TRANS))
             except Exception:
                 pass
 
     # Surface in Ha (hectares): 1 Ha = 10 000 m2
-    if data.get("required_land_area_m2") is None:
-        m_ha = re.search(
-            r"Sup\s*[:\-]?\s*(\d+(?:[.,]\d+)?)(?:\s*(?:-|à)\s*(\d+(?:[.,]\d+)?))?\s*Ha\b",
-            t,
-            re.IGNORECASE,
-        )
+    if data.get("required_land_area_m2") is None and "sup" in markers:
+        m_ha = _RE_SURF_HA.search(t)
         if m_ha:
             try:
-                h1 = float(m_ha.group(1).replace(",", "."))
-                h2 = m_ha.group(2)
-                if h2:
-                    h2 = float(h2.replace(",", "."))
-                    data["required_land_area_m2"] = ((h1 + h2) / 2) * 10_000
-                else:
-                    data["required_land_area_m2"] = h1 * 10_000
+                data["required_land_area_m2"] = _range_mean(m_ha.group(1), m_ha.group(2)) * 10_000
             except Exception:
                 pass
 
     # ROI / TRI
     # ROI / TRI (often appears without ":" in BK PDFs)
-    m_roi = re.search(r"TRI\s*(?:moyen)?\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*(?:-|à)\s*(\d+(?:[.,]\d+)?)\s*%?", t, re.IGNORECASE)
-    if not m_roi:
-        m_roi = re.search(r"TRI\s*(?:moyen)?\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*%?", t, re.IGNORECASE)
+    m_roi = _RE_TRI_RANGE.search(t) if "tri" in markers else None
+    if not m_roi and "tri" in markers:
+        m_roi = _RE_TRI_SINGLE.search(t)
     if m_roi:
         try:
-            r1 = float(m_roi.group(1).replace(",", "."))
             r2 = m_roi.group(2) if m_roi.lastindex and m_roi.lastindex >= 2 else None
-            if r2:
-                r2 = float(r2.replace(",", "."))
-                data["roi_estimated"] = (r1 + r2) / 2
-            else:
-                data["roi_estimated"] = r1
+            data["roi_estimated"] = _range_mean(m_roi.group(1), r2)
         except Exception:
             pass
 
     # Payback (PBP)
-    m_pbp = re.search(r"PBP\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*(?:-|à)?\s*(\d+(?:[.,]\d+)?)?\s*ans", t, re.IGNORECASE)
+    m_pbp = _RE_PBP.search(t) if "pbp" in markers else None
     if m_pbp:
         try:
-            p1 = float(m_pbp.group(1).replace(",", "."))
-            p2 = m_pbp.group(2)
-            if p2:
-                p2 = float(p2.replace(",", "."))
-                data["payback_period_years"] = (p1 + p2) / 2
-            else:
-                data["payback_period_years"] = p1
+            data["payback_period_years"] = _range_mean(m_pbp.group(1), m_pbp.group(2))
         except: pass
 
     # Some PDFs use "ROI : 4-5ans" as payback period (not ROI percentage)
-    if data.get("payback_period_years") is None:
-        m_roi_years = re.search(
-            r"\bROI\b\s*[:\-]?\s*(\d+(?:[.,]\d+)?)\s*(?:-|à)?\s*(\d+(?:[.,]\d+)?)?\s*ans",
-            t,
-            re.IGNORECASE,
-        )
+    if data.get("payback_period_years") is None and "roi" in markers:
+        m_roi_years = _RE_ROI_YEARS.search(t)
         if m_roi_years:
             try:
-                a = float(m_roi_years.group(1).replace(",", "."))
-                b = m_roi_years.group(2)
-                if b:
-                    b = float(b.replace(",", "."))
-                    data["payback_period_years"] = (a + b) / 2
-                else:
-                    data["payback_period_years"] = a
+                data["payback_period_years"] = _range_mean(m_roi_years.group(1), m_roi_years.group(2))
             except Exception:
                 pass
 
     # Deterministic fills for recommendation downstream
-    try:
-        if data.get("roi_estimated") is None and data.get("payback_period_years") is not None:
-            pb = float(data["payback_period_years"])
-            if pb > 0:
-                data["roi_estimated"] = round(100.0 / pb, 2)
-    except Exception:
-        pass
-
-    try:
-        if data.get("payback_period_years") is None and data.get("roi_estimated") is not None:
-            tri = float(data["roi_estimated"])
-            if 0 < tri <= 100:
-                data["payback_period_years"] = round(100.0 / tri, 2)
-    except Exception:
-        pass
+    roi, payback = _derive_roi_payback(data.get("roi_estimated"), data.get("payback_period_years"))
+    if roi is not None:
+        data["roi_estimated"] = roi
+    if payback is not None:
+        data["payback_period_years"] = payback
             
     # Province + zones
     data["province"] = extract_province(text)
@@ -545,7 +697,7 @@ def process_one_pdf(pdf_file_path: str, project_id: int) -> dict | None:
     path_obj = Path(pdf_file_path)
     filename = path_obj.name
 
-    layout_data = extract_text_with_layout(path_obj)
+    layout_data = extract_text_with_layout_cached(path_obj)
     if not layout_data["full_text"]:
         return None
 
@@ -560,8 +712,6 @@ def process_one_pdf(pdf_file_path: str, project_id: int) -> dict | None:
     if len(reference) > 100:
         reference = f"{ref_region}-{ref_title[:50]}-{project_id}"
 
-    est_mad = fields.get("estimated_investment_mad")
-
     return {
         "project_id": project_id,
         "project_reference": reference,
@@ -574,9 +724,7 @@ def process_one_pdf(pdf_file_path: str, project_id: int) -> dict | None:
         "region": region,
         "province": fields.get("province"),
         "industrial_zone": fields.get("industrial_zone"),
-        "estimated_investment_mad": est_mad,
-        "min_investment_mad": min_investment_mad(est_mad),
-        "investment_range": investment_range_label(est_mad),
+        "estimated_investment_mad": fields.get("estimated_investment_mad"),
         "payback_period_years": fields.get("payback_period_years"),
         "roi_estimated": fields.get("roi_estimated"),
         "required_land_area_m2": fields.get("required_land_area_m2"),
@@ -591,19 +739,38 @@ def process_one_pdf(pdf_file_path: str, project_id: int) -> dict | None:
         "source_type": SOURCE_TYPE,
     }
 
-def investment_range_label(estimated_mad: float | None) -> str | None:
-    if estimated_mad is None:
-        return None
-    if estimated_mad < INV_LOW_MAX:
-        return "Low"
-    if estimated_mad <= INV_MEDIUM_MAX:
-        return "Medium"
-    return "High"
-
-def min_investment_mad(estimated_mad: float | None) -> float | None:
-    if estimated_mad is None:
+def _process_one_pdf_safe(pdf_file_path: str, project_id: int) -> dict | None:
+    """Worker entry point: report errors per PDF instead of aborting the whole batch."""
+    try:
+        return process_one_pdf(pdf_file_path, project_id)
+    except Exception as e:
+        print(f"  Error processing PDF {Path(pdf_file_path).name} (worker): {e}", flush=True)
         return None
-    return round(estimated_mad * 0.8, 2)
+
+_INVESTMENT_RANGES = ("Low", "Medium", "High")
+
+
+def add_investment_bands(records: list[dict]) -> None:
+    """
+    Fill min_investment_mad (80% of the estimate) and investment_range for all
+    records at once, from a single float64 array of estimated_investment_mad.
+    """
+    if not records:
+        return
+    est = np.array(
+        [r.get("estimated_investment_mad") for r in records], dtype=np.float64
+    )  # None -> nan
+    missing = np.isnan(est).tolist()
+    bands = np.where(est < INV_LOW_MAX, 0, np.where(est <= INV_MEDIUM_MAX, 1, 2)).tolist()
+    mins = (est * 0.8).tolist()
+    for r, na, band, m in zip(records, missing, bands, mins):
+        if na:
+            r["min_investment_mad"] = None
+            r["investment_range"] = None
+        else:
+            # Python round(): exact decimal rounding, unlike np.round
+            r["min_investment_mad"] = round(m, 2)
+            r["investment_range"] = _INVESTMENT_RANGES[band]
 
 # ---------------------------------------------------------------------------
 # Output CSV helpers (refresh only this source, keep others)
@@ -638,77 +805,105 @@ OUTPUT_COLUMNS = [
 ]
 
 
-def _safe_read_existing_output(csv_path: Path) -> pd.DataFrame:
-    if not csv_path.exists():
-        return pd.DataFrame(columns=OUTPUT_COLUMNS)
-    try:
-        df = pd.read_csv(csv_path)
-        return df
-    except Exception as e:
-        print(f"Warning: cannot read {csv_path}: {e}")
-        return pd.DataFrame(columns=OUTPUT_COLUMNS)
+def _iter_raw_records(f):
+    """
+    Yield the raw text of each CSV record (one or more physical lines: a quoted
+    field may contain newlines), so rows can be copied without being re-encoded.
+    """
+    buf: list[str] = []
+    quotes = 0
+    for line in f:
+        if not buf and not line.strip():
+            continue
+        buf.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:  # every quoted field is closed
+            yield "".join(buf)
+            buf = []
+            quotes = 0
+    if buf:
+        yield "".join(buf)
 
 
-def _max_project_id(df: pd.DataFrame) -> int:
-    try:
-        if "project_id" in df.columns and not df.empty:
-            v = pd.to_numeric(df["project_id"], errors="coerce").max()
-            return int(v) if pd.notna(v) else 0
-    except Exception:
-        pass
-    return 0
+def _parse_record(raw: str) -> list[str]:
+    return next(csv.reader([raw]), [])
 
 
-def _remove_rows_for_this_source(df: pd.DataFrame) -> pd.DataFrame:
-    if df is None or df.empty:
-        return pd.DataFrame(columns=df.columns if df is not None else OUTPUT_COLUMNS)
+def _copy_rows_of_other_sources(csv_path: Path, out, writer) -> tuple[int, int, int]:
+    """
+    Stream an existing output CSV into `out`, keeping only rows of other sources
+    (e.g. cri_fes_mekness.py). Rows are copied verbatim when the header matches
+    OUTPUT_COLUMNS, re-mapped through `writer` otherwise (older schema).
+    Returns (rows read, rows kept, max project_id over all rows).
+    """
+    if not csv_path.exists():
+        return 0, 0, 0
+    start = out.tell()
+    total = kept = max_id = 0
+    try:
+        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+            records = _iter_raw_records(f)
+            header = _parse_record(next(records, ""))
+            same_schema = header == OUTPUT_COLUMNS
+            if "source_type" in header:
+                key_idx, key_value = header.index("source_type"), SOURCE_TYPE
+            elif "region" in header:
+                # Fallback (if schema changed): filter by region value
+                key_idx, key_value = header.index("region"), "Béni Mellal-Khénifra"
+            else:
+                key_idx, key_value = None, None
+            id_idx = header.index("project_id") if "project_id" in header else None
+
+            for raw in records:
+                row = _parse_record(raw)
+                total += 1
+                if id_idx is not None:
+                    try:
+                        max_id = max(max_id, int(float(row[id_idx])))
+                    except (IndexError, ValueError):
+                        pass
+                if key_idx is not None and key_idx < len(row) and row[key_idx] == key_value:
+                    continue
+                kept += 1
+                if same_schema:
+                    out.write(raw if raw.endswith(("\n", "\r")) else raw + os.linesep)
+                else:
+                    fields = dict(zip(header, row))
+                    writer.writerow([fields.get(c) for c in OUTPUT_COLUMNS])
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        print(f"Warning: cannot read {csv_path}: {e}")
+        out.seek(start)
+        out.truncate()
+        return 0, 0, 0
+    return total, kept, max_id
+
 
-    if "source_type" in df.columns:
-        kept = df[df["source_type"].astype(str) != SOURCE_TYPE].copy()
-        return kept
+# New rows are flushed to disk every CSV_FLUSH_EVERY PDFs (bounded memory, partial results on crash)
+CSV_FLUSH_EVERY = 20
 
-    # Fallback (if schema changed): filter by region value
-    if "region" in df.columns:
-        kept = df[df["region"].astype(str) != "Béni Mellal-Khénifra"].copy()
-        return kept
 
-    return df.copy()
+# Record dict -> row tuple in OUTPUT_COLUMNS order (C-level, unlike DictWriter's per-row list)
+_row_values = itemgetter(*OUTPUT_COLUMNS)
 
 
-def _ensure_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
-    for col in columns:
-        if col not in df.columns:
-            df[col] = None
-    return df[columns]
+def _output_writer(f):
+    return csv.writer(f, quoting=csv.QUOTE_NONNUMERIC, lineterminator=os.linesep)
 
 
-def _write_output_csv(df: pd.DataFrame, csv_path: Path) -> None:
+def _install_output_csv(tmp_path: Path, csv_path: Path, n_rows: int) -> None:
     """
-    Overwrite output_projects.csv safely.
-    If the file is open (PermissionError on Windows), write to output_projects_new.csv.
+    Move the freshly written CSV over output_projects.csv.
+    If the file is open (PermissionError on Windows), keep it as output_projects_new.csv.
     """
-    df_to_write = _ensure_columns(df, OUTPUT_COLUMNS)
     try:
-        df_to_write.to_csv(
-            csv_path,
-            index=False,
-            encoding="utf-8-sig",
-            sep=",",
-            quoting=csv.QUOTE_NONNUMERIC,
-        )
-        print(f"Wrote {len(df_to_write)} rows to {csv_path}")
+        os.replace(tmp_path, csv_path)
+        print(f"Wrote {n_rows} rows to {csv_path}")
     except OSError as e:
         # Windows: file might be open in Excel
         if getattr(e, "errno", None) == 13:
             fallback = csv_path.parent / "output_projects_new.csv"
-            df_to_write.to_csv(
-                fallback,
-                index=False,
-                encoding="utf-8-sig",
-                sep=",",
-                quoting=csv.QUOTE_NONNUMERIC,
-            )
-            print(f"Wrote {len(df_to_write)} rows to {fallback}")
+            os.replace(tmp_path, fallback)
+            print(f"Wrote {n_rows} rows to {fallback}")
             print("(output_projects.csv is open elsewhere — close it, then rename output_projects_new.csv if needed.)")
         else:
             raise
@@ -741,61 +936,104 @@ def _normalize_url(u: str) -> str:
         return u
 
 
-def collect_pdf_urls_from_site(start_url: str) -> set[str]:
+def _fetch_page(session: requests.Session, url: str) -> str | None:
+    try:
+        resp = session.get(url, headers=DEFAULT_HEADERS, timeout=25)
+        resp.raise_for_status()
+        return resp.text
+    except Exception as e:
+        print(f"Warning: failed to fetch {url}: {e}")
+        return None
+
+
+def _extract_links(html: str) -> tuple[list[str], list[str]]:
+    """
+    Return (<a href> values, <link rel="next"> href values) from a page.
+    Uses selectolax (C parser) when installed, else BeautifulSoup.
+    """
+    anchor_hrefs: list[str] = []
+    next_hrefs: list[str] = []
+
+    # Single traversal for both <a> and <link> tags.
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        for node in tree.css("a[href], link[href]"):
+            href = node.attributes.get("href") or ""
+            if node.tag == "a":
+                anchor_hrefs.append(href)
+            elif "next" in (node.attributes.get("rel") or "").lower():
+                next_hrefs.append(href)
+        return anchor_hrefs, next_hrefs
+
+    soup = BeautifulSoup(html, _BS_PARSER)
+    for tag in soup.find_all(["a", "link"], href=True):
+        href = tag.get("href") or ""
+        if tag.name == "a":
+            anchor_hrefs.append(href)
+        elif "next" in " ".join(tag.get("rel") or []).lower():
+            next_hrefs.append(href)
+    return anchor_hrefs, next_hrefs
+
+
+def collect_pdf_urls_from_site(start_url: str, session: requests.Session | None = None) -> set[str]:
     """
     Crawl listing + detail pages (1-level deep) to collect all PDF URLs.
     Handles pagination heuristically (links containing 'page=' and staying under /fr/projects).
+    Pages are fetched one BFS level at a time, CRAWL_WORKERS requests in flight.
     """
-    session = requests.Session()
+    session = session or _make_http_session()
     pdf_urls: set[str] = set()
-    visited: set[str] = set()
-    queue: list[str] = [start_url]
+    # URLs are deduplicated when queued, so each page enters the frontier once.
+    frontier: deque[str] = deque([_normalize_url(start_url)])
+    queued: set[str] = set(frontier)
+    fetched = 0
+
+    def _enqueue(u: str) -> None:
+        if u not in queued:
+            queued.add(u)
+            frontier.append(u)
 
     # Safety bounds to avoid crawling too much
     MAX_PAGES = 200
 
-    while queue and len(visited) < MAX_PAGES:
-        url = _normalize_url(queue.pop(0))
-        if url in visited:
-            continue
-        visited.add(url)
-
-        try:
-            resp = session.get(url, headers=DEFAULT_HEADERS, timeout=25)
-            resp.raise_for_status()
-        except Exception as e:
-            print(f"Warning: failed to fetch {url}: {e}")
-            continue
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = (a.get("href") or "").strip()
-            if not href:
-                continue
-            abs_url = _normalize_url(urljoin(url, href))
-            if not _is_same_site(abs_url):
-                continue
-
-            if ".pdf" in abs_url.lower():
-                pdf_urls.add(abs_url)
-                continue
-
-            # Stay within the projects area (listing, pagination, detail pages)
-            if "/fr/projects" in abs_url:
-                # Pagination links often contain page=...
-                if "page=" in abs_url or abs_url.rstrip("/") == start_url.rstrip("/"):
-                    queue.append(abs_url)
-                # Detail pages usually under /fr/projects/<slug>
-                elif abs_url.startswith(start_url.rstrip("/") + "/"):
-                    queue.append(abs_url)
-
-        # Also follow <link rel="next"> if present
-        for link in soup.find_all("link", href=True):
-            rel = " ".join(link.get("rel") or []).lower()
-            if "next" in rel:
-                next_url = _normalize_url(urljoin(url, link["href"]))
-                if _is_same_site(next_url) and "/fr/projects" in next_url:
-                    queue.append(next_url)
+    with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as ex:
+        while frontier and fetched < MAX_PAGES:
+            # Current BFS level (within the page budget); links found below form the next one.
+            batch = [frontier.popleft() for _ in range(min(len(frontier), MAX_PAGES - fetched))]
+            fetched += len(batch)
+
+            pages = ex.map(lambda u: _fetch_page(session, u), batch)
+            for url, html in zip(batch, pages):
+                if html is None:
+                    continue
+
+                anchor_hrefs, next_hrefs = _extract_links(html)
+                for href in anchor_hrefs:
+                    href = href.strip()
+                    if not href:
+                        continue
+                    abs_url = _normalize_url(urljoin(url, href))
+                    if not _is_same_site(abs_url):
+                        continue
+
+                    if ".pdf" in abs_url.lower():
+                        pdf_urls.add(abs_url)
+                        continue
+
+                    # Stay within the projects area (listing, pagination, detail pages)
+                    if "/fr/projects" in abs_url:
+                        # Pagination links often contain page=...
+                        if "page=" in abs_url or abs_url.rstrip("/") == start_url.rstrip("/"):
+                            _enqueue(abs_url)
+                        # Detail pages usually under /fr/projects/<slug>
+                        elif abs_url.startswith(start_url.rstrip("/") + "/"):
+                            _enqueue(abs_url)
+
+                # Also follow <link rel="next"> if present
+                for href in next_hrefs:
+                    next_url = _normalize_url(urljoin(url, href))
+                    if _is_same_site(next_url) and "/fr/projects" in next_url:
+                        _enqueue(next_url)
 
     return pdf_urls
 
@@ -810,41 +1048,175 @@ def _url_to_filename(pdf_url: str) -> str:
     return name
 
 
-def download_pdf(pdf_url: str, dest_dir: Path) -> Path | None:
+def _load_http_cache(cache_path: Path) -> dict:
+    """{url: {"etag": ..., "last_modified": ..., "size": ..., "mtime_ns": ...}} from previous runs."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_http_cache(cache: dict, cache_path: Path) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: cannot write {cache_path}: {e}")
+
+
+def _remember_download(http_cache: dict | None, pdf_url: str, headers, path: Path) -> None:
+    """
+    Store ETag / Last-Modified (for a conditional GET) and the local file's size/mtime
+    (to skip the request entirely while the file is untouched) for the next run.
+    """
+    if http_cache is None:
+        return
+    st = path.stat()
+    http_cache[pdf_url] = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+    }
+
+
+def _make_http_session() -> requests.Session:
+    """
+    One pooled session for the crawl and the downloads (same host: TCP/TLS connections
+    opened while crawling are reused for the PDFs). pool_block caps open connections per
+    host at the worker count instead of opening and discarding extra ones.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=max(CRAWL_WORKERS, DOWNLOAD_WORKERS), pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _content_length(headers) -> int | None:
+    try:
+        return int(headers.get("Content-Length", ""))
+    except ValueError:
+        return None
+
+
+def _write_stream(resp: requests.Response, dest_path: Path) -> None:
+    """
+    Write a streamed response body to disk in fixed chunks, unbuffered (os.write).
+    The body goes to <name>.part, which replaces dest_path only once fully received (bytes
+    read off the wire checked against Content-Length, which counts the encoded body even if
+    the server compressed it) and synced: an error or a short body leaves any existing copy
+    intact and no truncated PDF behind.
+    """
+    part_path = dest_path.with_suffix(".part")
+    expected = _content_length(resp.headers)
+    try:
+        fd = os.open(part_path, _WRITE_FLAGS, 0o644)
+        try:
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        received = resp.raw.tell()
+        if expected is not None and received != expected:
+            raise IOError(f"incomplete body: {received} of {expected} bytes")
+        os.replace(part_path, dest_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    finally:
+        resp.close()
+
+
+def download_pdf(
+    pdf_url: str,
+    dest_dir: Path,
+    session: requests.Session | None = None,
+    http_cache: dict | None = None,
+) -> Path | None:
+    """
+    Download one PDF into dest_dir.
+    A file downloaded by a previous run and untouched since (same size/mtime in http_cache)
+    is reused without any request. Otherwise, when validators from a completed download are
+    known, send a conditional GET (If-None-Match / If-Modified-Since): a 304 answer keeps the
+    local file. A local file without validators is kept when a HEAD reports its size; the
+    streaming GET is only sent once the body is known to be needed.
+    """
     dest_dir.mkdir(parents=True, exist_ok=True)
     filename = _url_to_filename(pdf_url)
     dest_path = dest_dir / filename
+    http = session or requests
 
-    # If file exists and seems complete, try to skip when same size
     try:
-        if dest_path.exists() and dest_path.stat().st_size > 0:
-            try:
-                h = requests.head(pdf_url, headers=DEFAULT_HEADERS, timeout=15, allow_redirects=True)
-                remote_size = int(h.headers.get("Content-Length", "0") or "0")
-                if remote_size > 0 and remote_size == dest_path.stat().st_size:
-                    return dest_path
-            except Exception:
-                # If HEAD fails, we keep local file (avoid re-downloading everything).
-                return dest_path
-    except Exception:
-        pass
+        st = dest_path.stat()
+        local_ok = st.st_size > 0
+    except OSError:
+        local_ok = False
+
+    # PDFs are already compressed: ask for the raw bytes, no gzip round-trip
+    headers = {**DEFAULT_HEADERS, "Accept-Encoding": "identity"}
+    cached = (http_cache or {}).get(pdf_url) if local_ok else None
+    if (
+        cached
+        and not REVALIDATE_DOWNLOADS
+        and cached.get("size") == st.st_size
+        and cached.get("mtime_ns") == st.st_mtime_ns
+    ):
+        return dest_path
+    # Validators only ever come from a completed download (never from a bare local mtime)
+    conditional = bool(cached and (cached.get("etag") or cached.get("last_modified")))
+    if conditional:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    elif local_ok:
+        # No validators yet: compare sizes with a HEAD, so that no streamed GET is opened
+        # (and its pooled connection dropped unread) for a file that is already complete
+        try:
+            h = http.head(pdf_url, headers=headers, timeout=15, allow_redirects=True)
+        except Exception:
+            # If HEAD fails, we keep local file (avoid re-downloading everything).
+            return dest_path
+        if h.ok and _content_length(h.headers) == st.st_size:
+            _remember_download(http_cache, pdf_url, h.headers, dest_path)
+            return dest_path
 
     try:
-        r = requests.get(pdf_url, stream=True, headers=DEFAULT_HEADERS, timeout=60)
+        r = http.get(pdf_url, stream=True, headers=headers, timeout=60)
+        if r.status_code == 304 and conditional:
+            r.close()
+            cached.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+            return dest_path
         r.raise_for_status()
-        with open(dest_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    f.write(chunk)
+        _write_stream(r, dest_path)
+        _remember_download(http_cache, pdf_url, r.headers, dest_path)
         return dest_path
     except Exception as e:
         print(f"Error downloading {pdf_url}: {e}")
+        if cached:
+            # Conditional GET failed: keep the local copy of a completed download.
+            return dest_path
         return None
 
 
 def downloader_tous_les_projets():
+    session = _make_http_session()
     print(f"Analyse de la page des projets : {URL_PROJETS}")
-    pdf_urls = collect_pdf_urls_from_site(URL_PROJETS)
+    pdf_urls = collect_pdf_urls_from_site(URL_PROJETS, session)
 
     total = len(pdf_urls)
     if total == 0:
@@ -853,59 +1225,83 @@ def downloader_tous_les_projets():
 
     print(f"{total} documents trouvés. Début du téléchargement...\n")
 
-    for i, url in enumerate(sorted(pdf_urls), start=1):
-        filename = _url_to_filename(url)
-        print(f"[{i}/{total}] Téléchargement : {filename}")
-        download_pdf(url, DOSSIER_CIBLE)
+    # One URL per local file (as with a serial loop over sorted URLs, the last one wins),
+    # so no two threads ever write the same path
+    urls_by_file = {_url_to_filename(url): url for url in sorted(pdf_urls)}
+
+    # Shared by the threads: each one only touches the entry of its own URL
+    http_cache = _load_http_cache(HTTP_CACHE_FILE)
+    try:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as ex:
+            futures = {
+                ex.submit(download_pdf, url, DOSSIER_CIBLE, session=session, http_cache=http_cache): filename
+                for filename, url in urls_by_file.items()
+            }
+            for i, fut in enumerate(as_completed(futures), start=1):
+                status = "Téléchargé" if fut.result() else "Échec"
+                print(f"[{i}/{len(futures)}] {status} : {futures[fut]}")
+    finally:
+        _save_http_cache(http_cache, HTTP_CACHE_FILE)
 
     print(f"\nTerminé ! {total} fichiers sont disponibles dans le dossier '{DOSSIER_CIBLE}'.")
 
 def process_pdfs():
-    # Load existing CSV and compute a global next_id (keeps IDs unique across sources and runs)
-    df_existing_full = _safe_read_existing_output(OUTPUT_CSV)
-    global_max_id = _max_project_id(df_existing_full)
-    next_id = global_max_id + 1
-
-    # Remove only this source rows (keep data from other scripts like cri_fes_mekness.py)
-    df_kept = _remove_rows_for_this_source(df_existing_full)
-    print(f"Existing rows: {len(df_existing_full)} | kept (other sources): {len(df_kept)} | next_id: {next_id}")
-
-    # 2. List PDFs
-    pdf_files = glob.glob(str(DOSSIER_CIBLE / "*.pdf"))
-    if not pdf_files:
-        print(f"No PDFs found in {DOSSIER_CIBLE}")
-        return
-
-    pdf_files = sorted(pdf_files)
-
-    extracted_rows: list[dict] = []
-    with ProcessPoolExecutor(max_workers=MAX_WORKERS) as ex:
-        futures = []
-        for idx, pdf_file in enumerate(pdf_files):
-            project_id = next_id + idx
-            futures.append(ex.submit(process_one_pdf, pdf_file, project_id))
-
-        done = 0
-        total = len(futures)
-        for fut in as_completed(futures):
-            done += 1
-            try:
-                row = fut.result()
-                if row:
-                    extracted_rows.append(row)
-            except Exception as e:
-                print(f"  Error processing PDF (worker): {e}", flush=True)
-            if done % 20 == 0 or done == total:
-                print(f"Processed {done}/{total} PDFs...", flush=True)
-
-    extracted_rows.sort(key=lambda r: r.get("project_id", 0))
+    # Rows are streamed into a temp file next to the output, which then replaces it
+    tmp_csv = OUTPUT_CSV.with_name(f"{OUTPUT_CSV.name}.{os.getpid()}.tmp")
+    n_new = 0
+    try:
+        with open(tmp_csv, "w", encoding="utf-8-sig", newline="") as out:
+            writer = _output_writer(out)
+            writer.writerow(OUTPUT_COLUMNS)
+
+            # Copy rows of other sources (e.g. cri_fes_mekness.py) and compute a global
+            # next_id in the same pass (keeps IDs unique across sources and runs)
+            n_existing, n_kept, global_max_id = _copy_rows_of_other_sources(OUTPUT_CSV, out, writer)
+            next_id = global_max_id + 1
+            print(f"Existing rows: {n_existing} | kept (other sources): {n_kept} | next_id: {next_id}")
+
+            # 2. List PDFs
+            pdf_files = glob.glob(str(DOSSIER_CIBLE / "*.pdf"))
+            if not pdf_files:
+                print(f"No PDFs found in {DOSSIER_CIBLE}")
+                out.close()
+                tmp_csv.unlink()
+                return
+
+            pdf_files = sorted(pdf_files)
+
+            # New rows come back in project_id order (ex.map keeps input order): they are
+            # appended as they arrive, no final sort/reorder pass
+            batch: list[dict] = []
+            total = len(pdf_files)
+            project_ids = range(next_id, next_id + total)
+            # Hand PDFs to workers in batches to amortize inter-process round-trips.
+            chunksize = max(1, total // (MAX_WORKERS * 4))
+            with ProcessPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                done = 0
+                for row in ex.map(_process_one_pdf_safe, pdf_files, project_ids, chunksize=chunksize):
+                    done += 1
+                    if row:
+                        batch.append(row)
+                    if done % CSV_FLUSH_EVERY == 0 or done == total:
+                        add_investment_bands(batch)
+                        writer.writerows(map(_row_values, batch))
+                        out.flush()
+                        n_new += len(batch)
+                        batch.clear()
+                        print(f"Processed {done}/{total} PDFs...", flush=True)
+    except BaseException:
+        if n_new and tmp_csv.exists():
+            # Interrupted / crashed run: keep what was extracted (valid CSV, other sources included)
+            partial = OUTPUT_CSV.with_name(f"{OUTPUT_CSV.stem}.partial.csv")
+            os.replace(tmp_csv, partial)
+            print(f"Interrupted: {n_new} new rows kept in {partial} ({OUTPUT_CSV} unchanged)")
+        else:
+            tmp_csv.unlink(missing_ok=True)
+        raise
 
     # Overwrite output_projects.csv: kept rows + new rows (this source refreshed)
-    df_new = pd.DataFrame(extracted_rows)
-    df_new = _ensure_columns(df_new, OUTPUT_COLUMNS)
-    df_kept = _ensure_columns(df_kept, OUTPUT_COLUMNS)
-    df_out = pd.concat([df_kept, df_new], ignore_index=True)
-    _write_output_csv(df_out, OUTPUT_CSV)
+    _install_output_csv(tmp_csv, OUTPUT_CSV, n_kept + n_new)
 
 if __name__ == "__main__":
     # If DOSSIER_CIBLE doesn't exist or is empty, maybe download first?
@@ -7,12 +7,21 @@ Processes Agro-Alimentaire, Agriculture, Tourisme and Industrie PDFs (same logic
 """
 
 import csv
+import hashlib
+import json
+import os
 import re
 import unicodedata
+from collections import namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 
+import numpy as np
 import pdfplumber
-import pandas as pd
+import pypdfium2 as pdfium
 
 
 # ---------------------------------------------------------------------------
@@ -41,22 +50,147 @@ INV_MEDIUM_MAX = 20_000_000
 # Standard ROI assumption when payback not in PDF
 ROI_ASSUMPTION_YEARS = 6
 
+# Page extraction runs in worker processes, each on a slice of at least PAGES_PER_WORKER pages
+# (smaller PDFs are read in-process: spawning/pickling would cost more than it saves)
+MAX_WORKERS = max(1, min(os.cpu_count() or 2, 8))
+PAGES_PER_WORKER = 10
+
+# Page extraction results per PDF, keyed by a hash of the PDF bytes (unchanged PDFs are not re-parsed)
+CACHE_DIR = SCRIPT_DIR / ".cache"
+PAGE_CACHE_VERSION = 1  # bump when page text / left-column extraction changes
+
+# ---------------------------------------------------------------------------
+# Precompiled regex patterns (compiled once at import, flags baked in)
+# ---------------------------------------------------------------------------
+_LETTER = "[a-zàâäéèêëïîôùûüç]"
+_RE_WS = re.compile(r"\s+")
+_RE_COMBINING_MARKS = re.compile(r"[\u0300-\u036f]+")
+_RE_NON_REF_CHARS = re.compile(r"[^\w\s\-]")
+_RE_SECTOR_FILENAME = re.compile(r"fiches-de-projets?-(.+?)-\d{5,8}$", re.IGNORECASE)
+
+# str.translate tables for captured numbers: delete every whitespace char (same set as \s in
+# str patterns, i.e. str.isspace(), NBSP included; the highest is U+3000), decimal comma -> dot
+_WHITESPACE_DELETE = dict.fromkeys(c for c in range(0x3001) if chr(c).isspace())
+_NUMBER_TRANS = {**_WHITESPACE_DELETE, ord(","): "."}
+
+# Description spacing fixes (_fix_missing_spaces_description)
+# Comma, period or closing paren directly followed by a letter (one pass for all three)
+_RE_FIX_PUNCT = re.compile(rf"([,.)])(?={_LETTER})", re.IGNORECASE)
+_RE_FIX_APOSTROPHE = re.compile(rf"((?![ld]){_LETTER})([''\u2019])({_LETTER})", re.IGNORECASE)
+_RE_FIX_OPEN_PAREN = re.compile(rf"({_LETTER})\(([A-Z])", re.IGNORECASE)
+
+# Project boundaries: PROJET N°36, N°A-001, N°T 001, N° T -002, N° T –016 (en-dash in Tourisme PDF)
+_RE_PROJECT_HEADER = re.compile(r"PROJET\s+N[°\s]*[A-Za-z]*[\-\s°º\u2013\u2014]*(\d+)", re.IGNORECASE)
+_RE_PROJECT_COLON = re.compile(r"PROJET\s*[:\-]", re.IGNORECASE)
+
+# Title
+_RE_TITLE_NUMBERED = re.compile(
+    r"PROJET\s+N[°\s]*[A-Za-z\-\s°º\u2013\u2014]*\d+\s*[:\-]?\s*(.+?)(?=FILIÈRE|FILIERE|Contact\s*:|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_RE_TITLE_COLON = re.compile(r"PROJET\s*[:\-]\s*(.+?)(?=MARCHÉ|MARCHE|FONCIER|$)", re.IGNORECASE | re.DOTALL)
+_RE_TITLE_NO_COLON = re.compile(
+    r"PROJET\s+N[°\s]*[A-Za-z\-\s°º\u2013\u2014]*\d+\s+([A-Za-zÀ-ÿ\s\-]+?)(?=MARCHÉ|MARCHE|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_RE_TRAILING_CONTACT = re.compile(r"\s+Contact\s*:.*$", re.IGNORECASE)
+
+# Sector / sub-sector
+_RE_SECTOR = re.compile(
+    r"FILI[ÈE]RE\s*[:\-]\s*(.+?)(?=SOUS-FILI[ÈE]RE|DESCRIPTION|INDICATEURS|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_RE_SECTOR_LINE_CONTACT = re.compile(r"(?:Contact|Email|T[ée]l)\s*:.*$", re.IGNORECASE)
+_RE_TOURISMEET = re.compile(r"tourismeet", re.IGNORECASE)
+_RE_SUB_SECTOR = re.compile(r"SOUS-FILIÈRE\s*[:\-]\s*(.+?)(?=DESCRIPTION|INDICATEURS|$)", re.IGNORECASE | re.DOTALL)
+_RE_CONTACT_LINE = re.compile(r"^(Contact|Email|Tél)\s*:", re.IGNORECASE)
+_RE_SUB_EMAIL = re.compile(r"\s+Email\s*:\s*\S+@\S+", re.IGNORECASE)
+_RE_SUB_PHONE = re.compile(r"\s+T[ée]l\s*:?\s*\+?[\d\s\-]+", re.IGNORECASE)
+_RE_SUB_CONTACT = re.compile(r"\s+Contact\s*:.*", re.IGNORECASE)
+# Each of the three patterns above starts with whitespace + Email/Tél/Contact
+_RE_SUB_CONTACT_HINT = re.compile(r"\s(?:Email|T[ée]l|Contact)", re.IGNORECASE)
+_RE_SUB_PREREQUIS = re.compile(r"\s*PR[ÉE]REQUIS\s+DU\s+PROJET\s*$", re.IGNORECASE)
+
+# Description (DESCRIPTION ... line-start INDICATEURS), see _description_block
+_RE_DESCRIPTION_START = re.compile(r"(DESCRIPTION)\s*", re.IGNORECASE)
+_RE_INDICATEURS_LINE = re.compile(r"\n\s*INDICATEURS\b", re.IGNORECASE)
+_RE_DESC_PREREQUIS = re.compile(r"^PR.REQUIS\s+DU\s+PROJET\s*", re.IGNORECASE)
+
+# Investment / payback / surfaces
+_RE_INVEST_MDH = re.compile(
+    r"Investissement\s*potentiel\s*\([^)]*\)\s*[:\-]\s*([\d\s,\.]+)\s*MDH",
+    re.IGNORECASE,
+)
+_RE_INVEST_DH = re.compile(
+    r"Investissement\s*potentiel\s*\([^)]*\)\s*[:\-]\s*([\d\s,\.]+)\s*DH\b",
+    re.IGNORECASE,
+)
+_RE_PAYBACK_RANGE = re.compile(
+    r"Retour\s+sur\s+investissement\s*\([^)]*\)\s*[:\-]\s*(\d+)\s*(?:à|-)\s*(\d+)\s*ans",
+    re.IGNORECASE,
+)
+_RE_PAYBACK_SINGLE = re.compile(
+    r"Retour\s+sur\s+investissement\s*\([^)]*\)\s*[:\-]\s*(\d+)\s*ans",
+    re.IGNORECASE | re.DOTALL,
+)
+_RE_LAND_M2 = re.compile(r"Superficie\s+souhait[ée]e\s+du\s+terrain\s*[:\-]\s*([\d\s,\.]+)\s*m2", re.IGNORECASE)
+_RE_TERRAIN_M2 = re.compile(r"terrain\s*[:\-]?\s*([\d\s,\.]+)\s*m2", re.IGNORECASE)
+_RE_LAND_HA = re.compile(r"Superficie\s+souhait[ée]e\s+du\s+terrain\s*[:\-]\s*([\d\s,\.]+)\s*Ha\b", re.IGNORECASE)
+_RE_TERRAIN_HA = re.compile(r"terrain\s*[:\-]?\s*([\d\s,\.]+)\s*Ha\b", re.IGNORECASE)
+_RE_LAND_RANGE_M2 = re.compile(
+    r"Superficie\s+souhait[ée]e\s*([\d\s,\.]+)(?:\s*[à\-]\s*[\d\s,\.]+)?\s*m2",
+    re.IGNORECASE,
+)
+_RE_BUILDING_M2 = re.compile(r"constructions?\s+de\s+([\d\s]+)\s*m2", re.IGNORECASE)
+
+# Field anchors for build_record: one pass finds where each field's keyword first appears.
+# Every pattern of a field starts with one of its anchors, so its search can start there.
+_RE_FIELD_ANCHORS = re.compile(
+    r"(?=(?P<title>PROJET)"
+    r"|(?P<sub_sector>SOUS-FILIÈRE)"
+    r"|(?P<sector>FILI[ÈE]RE)"
+    r"|(?P<invest>Investissement\s*potentiel)"
+    r"|(?P<payback>Retour\s+sur\s+investissement)"
+    r"|(?P<land>Superficie\s+souhait|terrain)"
+    r"|(?P<building>constructions?\s+de)"
+    r"|(?P<province>province|El\s*Hajeb|Hajeb|Taounate|Sefrou|Ifrane|Moulay Yacoub|Meknès|Fès))",
+    re.IGNORECASE,
+)
+
+# Location
+_RE_REGION_FES = re.compile(r"Fès|Fes-Meknès|Fès-Meknès|fesmeknes", re.IGNORECASE)
+_RE_REGION_LABEL = re.compile(r"R[ée]gion\s+[:\-]?\s*([A-Za-zÀ-ÿ\s\-]+?)(?:\n|$)")
+_RE_PROVINCE_LABEL = re.compile(r"province\s+[:\-]?\s*([A-Za-zÀ-ÿ\s\-]+?)(?:\n|\.|,|$)", re.IGNORECASE)
+# Specific first: El Hajeb, Taounate before Fès/Meknès from region name
+_RE_PROVINCE_NAMES = [
+    (name, re.compile(rf"\b{re.escape(name)}\b", re.IGNORECASE))
+    for name in ["El Hajeb", "Taounate", "Sefrou", "Ifrane", "Moulay Yacoub", "Meknès", "Fès"]
+]
+_RE_EL_HAJEB_LOOSE = re.compile(r"El\s*Hajeb|Hajeb\s*principale", re.IGNORECASE)
+
+# Publication date
+_RE_DATE_DMY = re.compile(r"(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})")
+_RE_DATE_YMD = re.compile(r"(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})")
+_RE_FILENAME_DDMMYYYY = re.compile(r"(\d{2})(\d{2})(\d{4})\D")
+_RE_FILENAME_DDMMYY = re.compile(r"(\d{2})(\d{2})(\d{2})\D")
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=4096)
 def _remove_accents(s: str) -> str:
     """Remove accents deterministically (NFD and strip combining marks)."""
-    nfd = unicodedata.normalize("NFD", s)
-    return "".join(c for c in nfd if unicodedata.category(c) != "Mn")
+    return _RE_COMBINING_MARKS.sub("", unicodedata.normalize("NFD", s))
 
 
+@lru_cache(maxsize=4096)
 def normalize_for_reference(s: str) -> str:
     """Uppercase, replace spaces with hyphens, remove accents. For project_reference."""
     if not s or not s.strip():
         return ""
     s = _remove_accents(s.strip())
-    s = re.sub(r"[^\w\s\-]", "", s)
-    s = re.sub(r"\s+", "-", s).strip("-")
+    s = _RE_NON_REF_CHARS.sub("", s)
+    s = _RE_WS.sub("-", s).strip("-")
     return s.upper() if s else ""
 
 
@@ -70,21 +204,16 @@ def _fix_missing_spaces_description(block: str) -> str:
     """
     if not block or len(block) < 2:
         return block
-    # 1) Comma without space after
-    block = re.sub(r",([a-zàâäéèêëïîôùûüç])", r", \1", block, flags=re.IGNORECASE)
+    # 1) Comma, period or closing paren followed by letter (no space). The inserted spaces
+    #    never create nor break a match of the other rules, so one pass replaces three.
+    block = _RE_FIX_PUNCT.sub(r"\1 ", block)
     # 2) Apostrophe: (letter not l/d) + apostrophe + letter -> letter + space + apostrophe + letter
     #    Handles quel'ail -> que l'ail, huiled'ail -> huile d'ail; keeps l'ail, d'ail intact
-    block = re.sub(
-        r"((?![ld])[a-zàâäéèêëïîôùûüç])([''\u2019])([a-zàâäéèêëïîôùûüç])",
-        r"\1 \2\3",
-        block,
-        flags=re.IGNORECASE,
-    )
-    # 3) Period or closing paren followed by letter (no space)
-    block = re.sub(r"\.([a-zàâäéèêëïîôùûüç])", r". \1", block, flags=re.IGNORECASE)
-    block = re.sub(r"\)([a-zàâäéèêëïîôùûüç])", r") \1", block, flags=re.IGNORECASE)
-    # 4) Opening paren preceded by letter: letter( -> letter (
-    block = re.sub(r"([a-zàâäéèêëïîôùûüç])\(([A-Z])", r"\1 (\2", block, flags=re.IGNORECASE)
+    if "'" in block or "\u2019" in block:
+        block = _RE_FIX_APOSTROPHE.sub(r"\1 \2\3", block)
+    # 3) Opening paren preceded by letter: letter( -> letter (
+    if "(" in block:
+        block = _RE_FIX_OPEN_PAREN.sub(r"\1 (\2", block)
     return block
 
 
@@ -98,7 +227,7 @@ def _sector_from_filename(pdf_path: Path) -> str:
     """
     name = pdf_path.stem
     # Match "projet-" or "projets-" then sector name until "-" + digits (date)
-    m = re.search(r"fiches-de-projets?-(.+?)-\d{5,8}$", name, re.IGNORECASE)
+    m = _RE_SECTOR_FILENAME.search(name)
     if m:
         sector = m.group(1).strip()
         if sector:
@@ -110,59 +239,115 @@ def _sector_from_filename(pdf_path: Path) -> str:
 # ---------------------------------------------------------------------------
 # PDF text extraction
 # ---------------------------------------------------------------------------
-def extract_text_per_page(pdf_path: Path) -> list[tuple[int, str]]:
-    """Extract raw text from each page. Returns list of (page_number_1based, text)."""
-    pages_text = []
+# One entry per page, in page order (pages[n - 1].num == n): raw text and left-column text
+PageRec = namedtuple("PageRec", "num text left")
+
+
+def _text_layer_pages(pdf_path: Path) -> tuple[int, list[int]] | None:
+    """
+    (page count, 0-based indexes of pages that have a text layer), read natively with PDFium.
+    None when PDFium cannot open the file.
+    """
+    try:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+    except Exception:
+        return None
+    try:
+        with_text = []
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                if textpage.count_chars() > 0:
+                    with_text.append(i)
+            finally:
+                textpage.close()
+                page.close()
+        return len(pdf), with_text
+    finally:
+        pdf.close()
+
+
+def _extract_page_range(pdf_path: Path, page_indexes: list[int]) -> list[tuple[int, str, str | None]]:
+    """
+    Worker: (page_number_1based, text, left_column_text) for the given 0-based page indexes.
+    Top-level so it can be pickled for ProcessPoolExecutor.
+    """
+    records = []
     with pdfplumber.open(pdf_path) as pdf:
-        for i, page in enumerate(pdf.pages):
-            text = page.extract_text()
-            pages_text.append((i + 1, text or ""))
-    return pages_text
+        pages = pdf.pages
+        for i in page_indexes:
+            page = pages[i]
+            records.append((i + 1, page.extract_text() or "", _page_left_column_text(page)))
+            # Drop the page's parsed layout (chars, text map) once both texts are taken;
+            # fonts stay cached in the document's resource manager for the next pages
+            page.close()
+    return records
+
+
+def extract_pages(pdf_path: Path, executor: Executor | None = None) -> list[PageRec]:
+    """
+    Extract raw text and left-column text of every page, in one pass per page.
+    PDFium finds the pages with a text layer; only those are parsed by pdfplumber (whose
+    row-ordered text the field regexes rely on). With an executor, they are split into
+    contiguous slices read in parallel, merged in page order.
+    """
+    layer = _text_layer_pages(pdf_path)
+    if layer is None:
+        with pdfplumber.open(pdf_path) as pdf:
+            n_pages = len(pdf.pages)
+        todo = list(range(n_pages))
+    else:
+        n_pages, todo = layer
+    # Pages without text (scans, blank pages): nothing for pdfplumber to find
+    todo_set = set(todo)
+    records = [(i + 1, "", "") for i in range(n_pages) if i not in todo_set]
+
+    workers = min(MAX_WORKERS, len(todo) // PAGES_PER_WORKER)
+    if executor is not None and workers >= 2:
+        step = -(-len(todo) // workers)  # ceil
+        futures = [
+            executor.submit(_extract_page_range, pdf_path, todo[k:k + step])
+            for k in range(0, len(todo), step)
+        ]
+        records += [rec for f in futures for rec in f.result()]
+    elif todo:
+        records += _extract_page_range(pdf_path, todo)
+    records.sort()
+    return [PageRec(*rec) for rec in records]
 
 
-def find_project_start_pages(pages_text: list[tuple[int, str]]) -> list[int]:
+def find_project_start_pages(pages: list[PageRec]) -> list[int]:
     """
     Detect pages where a new project starts.
     Matches: PROJET N°36, PROJET N°A-001, PROJET N°T 001, PROJET N° T °016 (Tourisme), or PROJET :
     Returns 1-based page numbers.
     """
     starts = []
-    for page_num, text in pages_text:
-        if page_num == 1:
+    # Fallback: pages with "PROJET" and (FILIÈRE or DESCRIPTION), collected in the same pass
+    fallback = []
+    for page_num, text, _ in pages:
+        # Both patterns need "PROJET": a substring test skips the regexes on most pages
+        if page_num == 1 or "projet" not in text.lower():
             continue
         # PROJET N°36, N°A-001, N°T 001, N° T -002, N° T –016 (en-dash \u2013 in Tourisme PDF)
-        if re.search(r"PROJET\s+N[°\s]*[A-Za-z]*[\-\s°º\u2013\u2014]*\d+", text, re.IGNORECASE):
+        if _RE_PROJECT_HEADER.search(text):
             starts.append(page_num)
-    if starts:
-        return sorted(starts)
-    # Fallback: pages with "PROJET" and (FILIÈRE or DESCRIPTION)
-    for page_num, text in pages_text:
-        if page_num == 1:
-            continue
-        if re.search(r"PROJET\s*[:\-]", text, re.IGNORECASE) and (
+        elif not starts and _RE_PROJECT_COLON.search(text) and (
             "FILIÈRE" in text or "FILIERE" in text or "DESCRIPTION" in text
         ):
-            starts.append(page_num)
-    return sorted(set(starts))
+            fallback.append(page_num)
+    return starts or fallback
 
 
-def _get_project_number_from_page(
-    pages_text: list[tuple[int, str]], page_num: int
-) -> str | None:
+def _get_project_number_from_page(pages: list[PageRec], page_num: int) -> str | None:
     """Extract project number (e.g. 001, 002) from page text. Used to dedupe continuation pages."""
-    text_by_page = dict(pages_text)
-    text = text_by_page.get(page_num, "")
-    m = re.search(
-        r"PROJET\s+N[°\s]*[A-Za-z]*[\-\s°º\u2013\u2014]*(\d+)",
-        text,
-        re.IGNORECASE,
-    )
+    text = pages[page_num - 1].text if 0 < page_num <= len(pages) else ""
+    m = _RE_PROJECT_HEADER.search(text)
     return m.group(1) if m else None
 
 
-def _dedupe_project_start_pages(
-    project_pages: list[int], pages_text: list[tuple[int, str]]
-) -> list[int]:
+def _dedupe_project_start_pages(project_pages: list[int], pages: list[PageRec]) -> list[int]:
     """
     Remove continuation pages: when page p and p-1 are both in list and have the same
     project number (e.g. Tourisme: page 4 and 5 both "T -002"), keep only p-1.
@@ -174,155 +359,183 @@ def _dedupe_project_start_pages(
     for p in sorted_pages[1:]:
         prev = kept[-1]
         if p == prev + 1:
-            num_p = _get_project_number_from_page(pages_text, p)
-            num_prev = _get_project_number_from_page(pages_text, prev)
+            num_p = _get_project_number_from_page(pages, p)
+            num_prev = _get_project_number_from_page(pages, prev)
             if num_p is not None and num_prev is not None and num_p == num_prev:
                 continue  # same project, skip continuation page
         kept.append(p)
     return kept
 
 
-def get_project_text_block(pages_text: list[tuple[int, str]], start_page: int) -> str:
+def get_project_text_block(pages: list[PageRec], start_page: int) -> str:
     """Get concatenated text for a project: start_page and next page (if any)."""
-    block = []
-    for pnum, text in pages_text:
-        if pnum == start_page or pnum == start_page + 1:
-            block.append(text)
-    return "\n".join(block)
+    return "\n".join(p.text for p in pages[start_page - 1:start_page + 1])
 
 
 # Left column ratio for two-column layout (description left, PRÉREQUIS right). No keyword logic.
 LEFT_COLUMN_RATIO = 0.5
 # Horizontal gap (points) between chars to treat as word boundary (insert space). From PDF layout.
 CHAR_GAP_SPACE_THRESHOLD = 2.5
+# C-level field access for pdfplumber char dicts
+_CHAR_X0 = itemgetter("x0")
+_CHAR_X1 = itemgetter("x1")
+_CHAR_TOP = itemgetter("top")
 
 
-def extract_text_from_left_column(
-    pdf_path: Path,
-    start_page: int,
-    num_pages: int = 2,
-    left_ratio: float = LEFT_COLUMN_RATIO,
-) -> str:
+def _round_1dp(values: np.ndarray) -> np.ndarray:
+    """
+    Python round(v, 1) over a float64 array. np.round (rint(v * 10) / 10) returns the same
+    double except right next to a ...5 tie, where v * 10 can round the other way; those few
+    values are redone with round().
+    """
+    out = np.round(values, 1)
+    scaled = values * 10
+    with np.errstate(invalid="ignore"):  # inf - inf for infinite values: never a tie
+        near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie).tolist():
+        out[i] = round(float(values[i]), 1)
+    return out
+
+
+def _page_left_column_text(page, left_ratio: float = LEFT_COLUMN_RATIO) -> str | None:
     """
-    Extract text from the LEFT side of the page only (layout-based, no keywords).
+    Text from the LEFT side of one page (layout-based, no keywords); None when it has no left chars.
     Uses page.chars + horizontal gap: insert space when gap between consecutive
     chars exceeds CHAR_GAP_SPACE_THRESHOLD. Preserves PDF layout spacing; dynamic for any project.
     """
-    parts = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for i in range(num_pages):
-            page_idx = (start_page - 1) + i
-            if page_idx < 0 or page_idx >= len(pdf.pages):
-                continue
-            page = pdf.pages[page_idx]
-            w = float(page.width)
-            x_max_left = w * left_ratio
-            chars = getattr(page, "chars", None)
-            if not chars:
-                # Fallback: extract_text on full page then crop by line (less reliable)
-                text = page.extract_text() or ""
-                parts.append(text.strip())
-                continue
-            left_chars = [c for c in chars if c["x1"] <= x_max_left]
-            left_chars.sort(key=lambda c: (round(c["top"], 1), c["x0"]))
-            if not left_chars:
-                continue
-            buf = []
-            prev = left_chars[0]
-            buf.append(prev.get("text", prev.get("char", "")))
-            for c in left_chars[1:]:
-                gap = c["x0"] - prev["x1"]
-                top_diff = c["top"] - prev["top"]
-                if top_diff > 3:
-                    buf.append("\n")
-                elif gap > CHAR_GAP_SPACE_THRESHOLD:
-                    buf.append(" ")
-                buf.append(c.get("text", c.get("char", "")))
-                prev = c
-            if buf:
-                parts.append("".join(buf).replace(" \n ", "\n").strip())
-    return "\n".join(parts)
+    w = float(page.width)
+    x_max_left = w * left_ratio
+    chars = getattr(page, "chars", None)
+    if not chars:
+        # Fallback: extract_text on full page then crop by line (less reliable)
+        text = page.extract_text() or ""
+        return text.strip()
+    # Chars entirely left of the split; pdfplumber's crop() would keep (and clip) chars
+    # straddling it, and filters in Python anyway
+    x1 = np.fromiter(map(_CHAR_X1, chars), dtype=np.float64, count=len(chars))
+    left_idx = np.flatnonzero(x1 <= x_max_left)
+    if not left_idx.size:
+        return None
+    left_chars = list(map(chars.__getitem__, left_idx.tolist()))
+    n = len(left_chars)
+    x0 = np.fromiter(map(_CHAR_X0, left_chars), dtype=np.float64, count=n)
+    top = np.fromiter(map(_CHAR_TOP, left_chars), dtype=np.float64, count=n)
+    # Reading order: line (top to 0.1pt, Python round) then x0; lexsort is stable like list.sort
+    top_key = _round_1dp(top)
+    order = np.lexsort((x0, top_key))
+    x0, x1, top = x0[order], x1[left_idx][order], top[order]
+    texts = [c.get("text", c.get("char", "")) for c in map(left_chars.__getitem__, order.tolist())]
+    # Separator before each char: newline on a line change, space on a horizontal gap
+    seps = np.where(
+        np.diff(top) > 3, "\n", np.where(x0[1:] - x1[:-1] > CHAR_GAP_SPACE_THRESHOLD, " ", "")
+    ).tolist()
+    text = texts[0] + "".join(chain.from_iterable(zip(seps, texts[1:])))
+    return text.replace(" \n ", "\n").strip()
+
+
+def extract_text_from_left_column(
+    pages: list[PageRec],
+    start_page: int,
+    num_pages: int = 2,
+) -> str:
+    """Left-column text of num_pages pages from start_page (per-page texts from extract_pages)."""
+    window = pages[start_page - 1:start_page - 1 + num_pages]
+    return "\n".join(p.left for p in window if p.left is not None)
+
+
+def _file_digest(path: Path) -> str:
+    """Content hash of a file (BLAKE2b, stdlib)."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def extract_pages_cached(pdf_path: Path, executor: Executor | None = None) -> list[PageRec]:
+    """extract_pages, reusing the result stored in CACHE_DIR for a PDF with the same content."""
+    cache_path = CACHE_DIR / f"fes-pages-v{PAGE_CACHE_VERSION}-{_file_digest(pdf_path)}.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return [PageRec(*rec) for rec in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        pass
+
+    pages = extract_pages(pdf_path, executor)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(pages, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: cannot write {cache_path}: {e}")
+    return pages
 
 
 # ---------------------------------------------------------------------------
 # Field extraction (deterministic regex only)
 # ---------------------------------------------------------------------------
-def _first_match(text: str, pattern: str, group: int = 1) -> str | None:
-    m = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+def _first_match(text: str, pattern: re.Pattern, group: int = 1, pos: int = 0) -> str | None:
+    m = pattern.search(text, pos)
     if m and m.lastindex >= group:
         return m.group(group).strip() or None
     return None
 
 
-def _first_match_int(text: str, pattern: str, group: int = 1) -> int | None:
-    s = _first_match(text, pattern, group)
+def _first_match_int(text: str, pattern: re.Pattern, group: int = 1, pos: int = 0) -> int | None:
+    s = _first_match(text, pattern, group, pos)
     if s is None:
         return None
-    s = re.sub(r"[\s\u00a0]", "", s).replace(",", ".")
+    s = s.translate(_NUMBER_TRANS)
     try:
         return int(float(s))
     except ValueError:
         return None
 
 
-def _first_match_float(text: str, pattern: str, group: int = 1) -> float | None:
-    s = _first_match(text, pattern, group)
+def _first_match_float(text: str, pattern: re.Pattern, group: int = 1, pos: int = 0) -> float | None:
+    s = _first_match(text, pattern, group, pos)
     if s is None:
         return None
-    s = re.sub(r"[\s\u00a0]", "", s).replace(",", ".")
+    s = s.translate(_NUMBER_TRANS)
     try:
         return float(s)
     except ValueError:
         return None
 
 
-def extract_project_title(text: str) -> str | None:
+def extract_project_title(text: str, pos: int = 0) -> str | None:
     # "PROJET N°XX : TITLE" or "PROJET N° T-002 : TITLE" / "PROJET N° T –016 : TITLE" (en-dash in Tourisme)
-    m = re.search(
-        r"PROJET\s+N[°\s]*[A-Za-z\-\s°º\u2013\u2014]*\d+\s*[:\-]?\s*(.+?)(?=FILIÈRE|FILIERE|Contact\s*:|$)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
+    m = _RE_TITLE_NUMBERED.search(text, pos)
     if m:
         t = m.group(1).strip()
-        t = re.sub(r"\s+", " ", t).strip()
-        t = re.sub(r"\s+Contact\s*:.*$", "", t, flags=re.IGNORECASE).strip()
+        t = _RE_WS.sub(" ", t).strip()
+        t = _RE_TRAILING_CONTACT.sub("", t).strip()
         if t and len(t) > 2:
             return t
     # Fallback: "PROJET : TITLE" or "PROJET N° T-002 STATION THERMALE" (second page, no colon before title)
-    m = re.search(
-        r"PROJET\s*[:\-]\s*(.+?)(?=MARCHÉ|MARCHE|FONCIER|$)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
+    m = _RE_TITLE_COLON.search(text, pos)
     if m:
         t = m.group(1).strip()
-        t = re.sub(r"\s+", " ", t).strip()
-        t = re.sub(r"\s+Contact\s*:.*$", "", t, flags=re.IGNORECASE).strip()
+        t = _RE_WS.sub(" ", t).strip()
+        t = _RE_TRAILING_CONTACT.sub("", t).strip()
         if t and len(t) > 2:
             return t
     # Second fallback: "PROJET N° X-XXX TITLE" (e.g. "PROJET N° T –016 TITLE" with en-dash)
-    m = re.search(
-        r"PROJET\s+N[°\s]*[A-Za-z\-\s°º\u2013\u2014]*\d+\s+([A-Za-zÀ-ÿ\s\-]+?)(?=MARCHÉ|MARCHE|$)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
+    m = _RE_TITLE_NO_COLON.search(text, pos)
     if m:
         t = m.group(1).strip()
-        t = re.sub(r"\s+", " ", t).strip()
+        t = _RE_WS.sub(" ", t).strip()
         if t and len(t) > 2:
             return t
     return None
 
 
-def extract_sector(text: str) -> str | None:
+def extract_sector(text: str, pos: int = 0) -> str | None:
     # On capture tout entre FILIÈRE et le prochain champ (SOUS-FILIÈRE ou DESCRIPTION)
     # Le DOTALL permet au '.' de prendre aussi les retours à la ligne (\n)
-    m = re.search(
-        r"FILI[ÈE]RE\s*[:\-]\s*(.+?)(?=SOUS-FILI[ÈE]RE|DESCRIPTION|INDICATEURS|$)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
+    m = _RE_SECTOR.search(text, pos)
     if m:
         block = m.group(1).strip()
         lines = block.split("\n")
@@ -333,7 +546,7 @@ def extract_sector(text: str) -> str | None:
             # Remove Contact/Email/Tel if they appear on the line
             # We use substitute to remove only the contact part + rest of line
             # This prevents killing the *next* line if we were doing a full block regex
-            line = re.sub(r"(?:Contact|Email|T[ée]l)\s*:.*$", "", line, flags=re.IGNORECASE)
+            line = _RE_SECTOR_LINE_CONTACT.sub("", line)
             line = line.strip()
             if line:
                 cleaned_lines.append(line)
@@ -341,20 +554,16 @@ def extract_sector(text: str) -> str | None:
         s = " ".join(cleaned_lines)
 
         # Correction spécifique pour le PDF Nouvelles Technologies
-        s = re.sub(r"tourismeet", "TOURISME ET", s, flags=re.IGNORECASE)
+        s = _RE_TOURISMEET.sub("TOURISME ET", s)
         
-        s = re.sub(r"\s+", " ", s).strip()
+        s = _RE_WS.sub(" ", s).strip()
         return s if s else None
     return None
 
 
-def extract_sub_sector(text: str) -> str | None:
+def extract_sub_sector(text: str, pos: int = 0) -> str | None:
     # Full sub-sector: capture until DESCRIPTION or INDICATEURS (so "L'AIL" on next line is included)
-    m = re.search(
-        r"SOUS-FILIÈRE\s*[:\-]\s*(.+?)(?=DESCRIPTION|INDICATEURS|$)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
+    m = _RE_SUB_SECTOR.search(text, pos)
     if m:
         block = m.group(1).strip()
         # Remove only lines that are Contact/Email/Tél (keep lines like "L'AIL")
@@ -363,42 +572,36 @@ def extract_sub_sector(text: str) -> str | None:
             line.strip()
             for line in lines
             if line.strip()
-            and not re.match(r"^(Contact|Email|Tél)\s*:", line.strip(), re.IGNORECASE)
+            and not _RE_CONTACT_LINE.match(line.strip())
         ]
         s = " ".join(kept)
-        # Remove " Email : address@domain" and " Tél/Tél: +212..." (any format)
-        s = re.sub(r"\s+Email\s*:\s*\S+@\S+", "", s, flags=re.IGNORECASE)
-        s = re.sub(r"\s+T[ée]l\s*:?\s*\+?[\d\s\-]+", "", s, flags=re.IGNORECASE)
-        s = re.sub(r"\s+Contact\s*:.*", "", s, flags=re.IGNORECASE)
+        # Remove " Email : address@domain" and " Tél/Tél: +212..." (any format);
+        # one scan first, as most sub-sectors carry no contact details
+        if _RE_SUB_CONTACT_HINT.search(s):
+            s = _RE_SUB_EMAIL.sub("", s)
+            s = _RE_SUB_PHONE.sub("", s)
+            s = _RE_SUB_CONTACT.sub("", s)
         # Remove trailing "PRÉREQUIS DU PROJET" or similar
-        s = re.sub(r"\s*PR[ÉE]REQUIS\s+DU\s+PROJET\s*$", "", s, flags=re.IGNORECASE)
-        s = re.sub(r"\s+", " ", s).strip()
+        s = _RE_SUB_PREREQUIS.sub("", s)
+        s = _RE_WS.sub(" ", s).strip()
         return s or None
     return None
 
 
-def extract_estimated_investment_mad(text: str) -> float | None:
+def extract_estimated_investment_mad(text: str, pos: int = 0) -> float | None:
     # "Investissement potentiel(hors foncier) : 11 MDH" or "Investissementpotentiel" (no space, some PDFs)
-    m = re.search(
-        r"Investissement\s*potentiel\s*\([^)]*\)\s*[:\-]\s*([\d\s,\.]+)\s*MDH",
-        text,
-        re.IGNORECASE,
-    )
+    m = _RE_INVEST_MDH.search(text, pos)
     if m:
-        s = re.sub(r"[\s\u00a0]", "", m.group(1)).replace(",", ".")
+        s = m.group(1).translate(_NUMBER_TRANS)
         try:
             val = float(s)
             return val * 1_000_000 if val < 1000 else val  # MDH -> MAD
         except ValueError:
             pass
     # "X DH" (dirhams, value in MAD: 900 000 DH = 900000 MAD, 500 000 DH = 500000 MAD)
-    m = re.search(
-        r"Investissement\s*potentiel\s*\([^)]*\)\s*[:\-]\s*([\d\s,\.]+)\s*DH\b",
-        text,
-        re.IGNORECASE,
-    )
+    m = _RE_INVEST_DH.search(text, pos)
     if m:
-        s = re.sub(r"[\s\u00a0]", "", m.group(1)).replace(",", ".")
+        s = m.group(1).translate(_NUMBER_TRANS)
         try:
             val = float(s)
             return val  # already in MAD
@@ -407,114 +610,124 @@ def extract_estimated_investment_mad(text: str) -> float | None:
     return None
 
 
-def extract_project_description_from_layout(pdf_path: Path, start_page: int) -> str | None:
+def _description_block(text: str) -> str | None:
+    r"""
+    Text after DESCRIPTION up to the next line-start INDICATEURS (or the end): same result as
+    DESCRIPTION\s*(.+?)(?=\n\s*INDICATEURS\b|$) with DOTALL, but found with two forward
+    scans instead of a lazy match that retries the lookahead at every character.
+    """
+    m = _RE_DESCRIPTION_START.search(text)
+    if not m:
+        return None
+    n = len(text)
+    start = m.end()
+    if start == n:
+        if m.end(1) == n:
+            return None
+        start -= 1  # only whitespace left: the block is its last char
+    # "$" also matches before a final newline
+    end = n - 1 if text.endswith("\n") and n - 1 > start else n
+    stop = _RE_INDICATEURS_LINE.search(text, start + 1)
+    if stop and stop.start() < end:
+        end = stop.start()
+    return text[start:end]
+
+
+def extract_project_description_from_layout(pages: list[PageRec], start_page: int) -> str | None:
     """
     Extract description from the LEFT column only (layout-based, no keywords).
     Crop page to left half → get only description column; same logic for all projects.
     """
-    left_text = extract_text_from_left_column(pdf_path, start_page, num_pages=2)
+    left_text = extract_text_from_left_column(pages, start_page, num_pages=2)
     if not left_text or not left_text.strip():
         return None
     # In left column, take block between DESCRIPTION and INDICATEURS (or end).
     # Stop at line-start INDICATEURS (section title) so "indicateurs" mid-sentence does not cut.
-    m = re.search(
-        r"DESCRIPTION\s*(.+?)(?=\n\s*INDICATEURS\b|$)",
-        left_text,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not m:
+    block = _description_block(left_text)
+    if block is None:
         return None
-    block = m.group(1).strip()
+    block = block.strip()
     # Strip header line "PRÉREQUIS DU PROJET" when on same line as DESCRIPTION
-    block = re.sub(r"^PR.REQUIS\s+DU\s+PROJET\s*", "", block, flags=re.IGNORECASE).strip()
+    block = _RE_DESC_PREREQUIS.sub("", block).strip()
     # Strip trailing "Contact : ..." (layout artifact in left column)
-    block = re.sub(r"\s+Contact\s*:.*$", "", block, flags=re.IGNORECASE).strip()
-    block = re.sub(r"\s+", " ", block).strip()
+    block = _RE_TRAILING_CONTACT.sub("", block).strip()
+    block = _RE_WS.sub(" ", block).strip()
     block = _fix_missing_spaces_description(block)
     if block and len(block) >= 20:
         return block
     return None
 
 
-def extract_project_description(text: str, pdf_path: Path | None = None, start_page: int | None = None) -> str | None:
+def extract_project_description(
+    text: str, pages: list[PageRec] | None = None, start_page: int | None = None
+) -> str | None:
     """
-    Prefer layout-based extraction (left column only) when pdf_path and start_page are given.
+    Prefer layout-based extraction (left column only) when pages and start_page are given.
     Fallback: take DESCRIPTION...INDICATEURS from full text (may contain mixed columns).
     """
-    if pdf_path is not None and start_page is not None:
-        desc = extract_project_description_from_layout(pdf_path, start_page)
+    if pages is not None and start_page is not None:
+        desc = extract_project_description_from_layout(pages, start_page)
         if desc:
             return desc
     # Fallback: full text block (mixed columns). Stop at line-start INDICATEURS only.
-    m = re.search(
-        r"DESCRIPTION\s*(.+?)(?=\n\s*INDICATEURS\b|$)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if m:
-        block = re.sub(r"^PR.REQUIS\s+DU\s+PROJET\s*", "", m.group(1).strip(), flags=re.IGNORECASE)
-        block = re.sub(r"\s+Contact\s*:.*$", "", block, flags=re.IGNORECASE).strip()
-        block = re.sub(r"\s+", " ", block).strip()
+    block = _description_block(text)
+    if block is not None:
+        block = _RE_DESC_PREREQUIS.sub("", block.strip())
+        block = _RE_TRAILING_CONTACT.sub("", block).strip()
+        block = _RE_WS.sub(" ", block).strip()
         block = _fix_missing_spaces_description(block)
         if block and len(block) >= 20:
             return block
     return None
 
 
-def extract_payback_period_years(text: str) -> float | None:
+def extract_payback_period_years(text: str, pos: int = 0) -> float | None:
     # "Retour sur investissement(ROI) : 5 à 6 ans" or "6 ans" or "5 - 6 ans"
-    m = re.search(
-        r"Retour\s+sur\s+investissement\s*\([^)]*\)\s*[:\-]\s*(\d+)\s*(?:à|-)\s*(\d+)\s*ans",
-        text,
-        re.IGNORECASE,
-    )
+    m = _RE_PAYBACK_RANGE.search(text, pos)
     if m:
         try:
             a, b = int(m.group(1)), int(m.group(2))
             return (a + b) / 2.0
         except ValueError:
             pass
-    m = re.search(r"Retour\s+sur\s+investissement\s*\([^)]*\)\s*[:\-]\s*(\d+)\s*ans", text, re.IGNORECASE)
-    if m:
-        return _first_match_float(text, r"Retour\s+sur\s+investissement\s*\([^)]*\)\s*[:\-]\s*(\d+)\s*ans", 1)
-    return None
+    return _first_match_float(text, _RE_PAYBACK_SINGLE, 1, pos)
 
 
-def extract_required_land_area_m2(text: str) -> float | None:
+def extract_required_land_area_m2(text: str, pos: int = 0) -> float | None:
     # m2
-    m = re.search(r"Superficie\s+souhait[ée]e\s+du\s+terrain\s*[:\-]\s*([\d\s,\.]+)\s*m2", text, re.IGNORECASE)
+    m = _RE_LAND_M2.search(text, pos)
     if m:
-        s = re.sub(r"[\s\u00a0]", "", m.group(1)).replace(",", ".")
+        s = m.group(1).translate(_NUMBER_TRANS)
         try:
             return float(s)
         except ValueError:
             pass
-    m = re.search(r"terrain\s*[:\-]?\s*([\d\s,\.]+)\s*m2", text, re.IGNORECASE)
+    m = _RE_TERRAIN_M2.search(text, pos)
     if m:
-        s = re.sub(r"\s", "", m.group(1)).replace(",", ".")
+        s = m.group(1).translate(_NUMBER_TRANS)
         try:
             return float(s)
         except ValueError:
             pass
     # Ha (hectares): 1 Ha = 10 000 m2 (Agriculture PDFs)
-    m = re.search(r"Superficie\s+souhait[ée]e\s+du\s+terrain\s*[:\-]\s*([\d\s,\.]+)\s*Ha\b", text, re.IGNORECASE)
+    m = _RE_LAND_HA.search(text, pos)
     if m:
-        s = re.sub(r"[\s\u00a0]", "", m.group(1)).replace(",", ".")
+        s = m.group(1).translate(_NUMBER_TRANS)
         try:
             return float(s) * 10_000
         except ValueError:
             pass
-    m = re.search(r"terrain\s*[:\-]?\s*([\d\s,\.]+)\s*Ha\b", text, re.IGNORECASE)
+    m = _RE_TERRAIN_HA.search(text, pos)
     if m:
-        s = re.sub(r"\s", "", m.group(1)).replace(",", ".")
+        s = m.group(1).translate(_NUMBER_TRANS)
         try:
             return float(s) * 10_000
         except ValueError:
             pass
     # "Superficie souhaitée 200 à 300 m2" or "200 à 300m2" (take first number)
-    m = re.search(r"Superficie\s+souhait[ée]e\s*([\d\s,\.]+)(?:\s*[à\-]\s*[\d\s,\.]+)?\s*m2", text, re.IGNORECASE)
+    m = _RE_LAND_RANGE_M2.search(text, pos)
     if m:
-        s = re.sub(r"[\s\u00a0]", "", m.group(1)).replace(",", ".")
+        s = m.group(1).translate(_NUMBER_TRANS)
         try:
             return float(s)
         except ValueError:
@@ -522,10 +735,10 @@ def extract_required_land_area_m2(text: str) -> float | None:
     return None
 
 
-def extract_required_building_area_m2(text: str) -> float | None:
-    m = re.search(r"constructions?\s+de\s+([\d\s]+)\s*m2", text, re.IGNORECASE)
+def extract_required_building_area_m2(text: str, pos: int = 0) -> float | None:
+    m = _RE_BUILDING_M2.search(text, pos)
     if m:
-        s = re.sub(r"\s", "", m.group(1))
+        s = m.group(1).translate(_WHITESPACE_DELETE)
         try:
             return float(s)
         except ValueError:
@@ -535,24 +748,24 @@ def extract_required_building_area_m2(text: str) -> float | None:
 
 def extract_region(text: str) -> str | None:
     # Document is from fesmeknesinvest.ma; "Fès" appears in text
-    if re.search(r"Fès|Fes-Meknès|Fès-Meknès|fesmeknes", text, re.IGNORECASE):
+    if _RE_REGION_FES.search(text):
         return "Fès-Meknès"
-    m = re.search(r"R[ée]gion\s+[:\-]?\s*([A-Za-zÀ-ÿ\s\-]+?)(?:\n|$)", text)
+    m = _RE_REGION_LABEL.search(text)
     if m:
         return m.group(1).strip() or None
     return None
 
 
-def extract_province(text: str) -> str | None:
-    m = re.search(r"province\s+[:\-]?\s*([A-Za-zÀ-ÿ\s\-]+?)(?:\n|\.|,|$)", text, re.IGNORECASE)
+def extract_province(text: str, pos: int = 0) -> str | None:
+    m = _RE_PROVINCE_LABEL.search(text, pos)
     if m:
         return m.group(1).strip() or None
     # Province names (specific first: El Hajeb, Taounate before Fès/Meknès from region name)
-    for name in ["El Hajeb", "Taounate", "Sefrou", "Ifrane", "Moulay Yacoub", "Meknès", "Fès"]:
-        if re.search(rf"\b{re.escape(name)}\b", text, re.IGNORECASE):
+    for name, pattern in _RE_PROVINCE_NAMES:
+        if pattern.search(text, pos):
             return name
     # El Hajeb sometimes without space (ElHajeb) or after apostrophe (d'El Hajeb)
-    if re.search(r"El\s*Hajeb|Hajeb\s*principale", text, re.IGNORECASE):
+    if _RE_EL_HAJEB_LOOSE.search(text, pos):
         return "El Hajeb"
     return None
 
@@ -565,23 +778,21 @@ def extract_industrial_zone(text: str) -> str | None:
     return "; ".join(zones) if zones else None
 
 
-def extract_publication_date(
-    pages_text: list[tuple[int, str]], pdf_path: Path
-) -> str | None:
+def extract_publication_date(pages: list[PageRec], pdf_path: Path) -> str | None:
     # From cover (page 1)
-    cover = next((t for p, t in pages_text if p == 1), "")
-    m = re.search(r"(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})", cover)
+    cover = pages[0].text if pages else ""
+    m = _RE_DATE_DMY.search(cover)
     if m:
         return f"{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"
-    m = re.search(r"(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})", cover)
+    m = _RE_DATE_YMD.search(cover)
     if m:
         return f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"
     # From filename: 8 digits ddmmyyyy (23052025 -> 2025-05-23) or 6 digits ddmmyy (230225 -> 2023-02-25)
     name = pdf_path.name
-    dm8 = re.search(r"(\d{2})(\d{2})(\d{4})\D", name)  # DD MM YYYY
+    dm8 = _RE_FILENAME_DDMMYYYY.search(name)  # DD MM YYYY
     if dm8:
         return f"{dm8.group(3)}-{dm8.group(2)}-{dm8.group(1)}"
-    dm6 = re.search(r"(\d{2})(\d{2})(\d{2})\D", name)  # DD MM YY
+    dm6 = _RE_FILENAME_DDMMYY.search(name)  # DD MM YY
     if dm6:
         return f"20{dm6.group(3)}-{dm6.group(2)}-{dm6.group(1)}"
     if "23 05 2025" in cover:
@@ -589,6 +800,14 @@ def extract_publication_date(
     return None
 
 
+def _find_field_anchors(text: str) -> dict[str, int]:
+    """One pass over a project block: {field: position of its first anchor}. Absent field -> no key."""
+    anchors = {}
+    for m in _RE_FIELD_ANCHORS.finditer(text):
+        anchors.setdefault(m.lastgroup, m.start())
+    return anchors
+
+
 # ---------------------------------------------------------------------------
 # Calculated fields
 # ---------------------------------------------------------------------------
@@ -622,20 +841,28 @@ def build_record(
     project_index: int,
     start_page: int,
     text: str,
-    pages_text: list[tuple[int, str]],
+    pages: list[PageRec],
     pdf_path: Path,
     publication_date: str | None,
 ) -> dict:
-    title = extract_project_title(text)
+    # One scan for all field keywords; each extractor then only searches from its anchor,
+    # and is skipped when the keyword is absent from the block.
+    anchors = _find_field_anchors(text)
+
+    def field(extractor, key):
+        pos = anchors.get(key)
+        return extractor(text, pos) if pos is not None else None
+
+    title = field(extract_project_title, "title")
     # Sector: based on FILIÈRE in PDF (e.g. "FILIÈRE : Tourisme" → TOURISME). Fallback to filename only when FILIÈRE is missing.
-    sector_raw = extract_sector(text) or (_sector_from_filename(pdf_path) if pdf_path else None) or "CRI"
+    sector_raw = field(extract_sector, "sector") or (_sector_from_filename(pdf_path) if pdf_path else None) or "CRI"
     sector = (sector_raw or "CRI").strip().upper()
     region = extract_region(text)
     if not region and "fesmeknes" in str(pdf_path).lower():
         region = "Fès-Meknès"
 
-    est_mad = extract_estimated_investment_mad(text)
-    payback = extract_payback_period_years(text)
+    est_mad = field(extract_estimated_investment_mad, "invest")
+    payback = field(extract_payback_period_years, "payback")
     roi_est = roi_estimated_only(payback)
 
     # project_id: integer, auto-incremented
@@ -653,21 +880,21 @@ def build_record(
         "project_id": project_id,
         "project_reference": project_reference,
         "project_title": title,
-        "project_description": extract_project_description(text, pdf_path, start_page),
+        "project_description": extract_project_description(text, pages, start_page),
         "sector": sector,
-        "sub_sector": extract_sub_sector(text),
+        "sub_sector": field(extract_sub_sector, "sub_sector"),
         "project_bank_category": project_bank_category,
         "is_project_bank": True,
         "region": region,
-        "province": extract_province(text),
+        "province": field(extract_province, "province"),
         "industrial_zone": extract_industrial_zone(text),
         "estimated_investment_mad": round(est_mad, 2) if est_mad is not None else None,
         "min_investment_mad": min_investment_mad(est_mad),
         "investment_range": investment_range_label(est_mad),
         "payback_period_years": round(payback, 2) if payback is not None else None,
         "roi_estimated": round(roi_est, 2) if roi_est is not None else None,
-        "required_land_area_m2": extract_required_land_area_m2(text),
-        "required_building_area_m2": extract_required_building_area_m2(text),
+        "required_land_area_m2": field(extract_required_land_area_m2, "land"),
+        "required_building_area_m2": field(extract_required_building_area_m2, "building"),
         "has_pdf": True,
         "pdf_url": str(pdf_path.resolve()),
         "pdf_page_number": start_page,
@@ -679,6 +906,53 @@ def build_record(
     }
 
 
+# ---------------------------------------------------------------------------
+# Output CSV
+# ---------------------------------------------------------------------------
+OUTPUT_COLUMNS = [
+    "project_id",
+    "project_reference",
+    "project_title",
+    "project_description",
+    "sector",
+    "sub_sector",
+    "project_bank_category",
+    "is_project_bank",
+    "region",
+    "province",
+    "industrial_zone",
+    "estimated_investment_mad",
+    "min_investment_mad",
+    "investment_range",
+    "payback_period_years",
+    "roi_estimated",
+    "required_land_area_m2",
+    "required_building_area_m2",
+    "has_pdf",
+    "pdf_url",
+    "pdf_page_number",
+    "publication_date",
+    "last_update",
+    "language",
+    "currency",
+    "source_type",
+]
+
+
+_row_values = itemgetter(*OUTPUT_COLUMNS)
+
+
+def _write_output_csv(rows: list[dict], path: Path) -> None:
+    """
+    Stream records to CSV with the stdlib writer: numbers unquoted, text quoted,
+    missing values written as "NULL". Rows are handed to writerows in one call.
+    """
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC, lineterminator=os.linesep)
+        writer.writerow(OUTPUT_COLUMNS)
+        writer.writerows(["NULL" if v is None else v for v in _row_values(row)] for row in rows)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -686,83 +960,40 @@ def main() -> None:
     rows = []
     global_index = 1
 
-    for filename in PDF_FILENAMES:
-        pdf_path = SCRIPT_DIR / filename
-        if not pdf_path.exists():
-            print(f"Skip (not found): {filename}")
-            continue
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for filename in PDF_FILENAMES:
+            pdf_path = SCRIPT_DIR / filename
+            if not pdf_path.exists():
+                print(f"Skip (not found): {filename}")
+                continue
+
+            # Pages are parsed once (text + left-column layout), in parallel for long PDFs,
+            # and not at all when this exact PDF was already extracted
+            pages = extract_pages_cached(pdf_path, executor)
+            project_pages = find_project_start_pages(pages)
+            project_pages = [p for p in project_pages if p > 1]
+            project_pages = _dedupe_project_start_pages(project_pages, pages)
+
+            publication_date = extract_publication_date(pages, pdf_path)
+
+            for start_page in project_pages:
+                text = get_project_text_block(pages, start_page)
+                record = build_record(
+                    global_index, start_page, text, pages, pdf_path, publication_date
+                )
+                rows.append(record)
+                global_index += 1
 
-        pages_text = extract_text_per_page(pdf_path)
-        project_pages = find_project_start_pages(pages_text)
-        project_pages = [p for p in project_pages if p > 1]
-        project_pages = _dedupe_project_start_pages(project_pages, pages_text)
-
-        publication_date = extract_publication_date(pages_text, pdf_path)
-
-        for start_page in project_pages:
-            text = get_project_text_block(pages_text, start_page)
-            record = build_record(
-                global_index, start_page, text, pages_text, pdf_path, publication_date
-            )
-            rows.append(record)
-            global_index += 1
-
-        print(f"  {filename}: {len(project_pages)} projects")
-
-    df = pd.DataFrame(rows)
-
-    column_order = [
-        "project_id",
-        "project_reference",
-        "project_title",
-        "project_description",
-        "sector",
-        "sub_sector",
-        "project_bank_category",
-        "is_project_bank",
-        "region",
-        "province",
-        "industrial_zone",
-        "estimated_investment_mad",
-        "min_investment_mad",
-        "investment_range",
-        "payback_period_years",
-        "roi_estimated",
-        "required_land_area_m2",
-        "required_building_area_m2",
-        "has_pdf",
-        "pdf_url",
-        "pdf_page_number",
-        "publication_date",
-        "last_update",
-        "language",
-        "currency",
-        "source_type",
-    ]
-    df = df[[c for c in column_order if c in df.columns]]
+            print(f"  {filename}: {len(project_pages)} projects")
 
     try:
-        df.to_csv(
-            OUTPUT_CSV,
-            index=False,
-            encoding="utf-8-sig",
-            sep=",",
-            na_rep="NULL",
-            quoting=csv.QUOTE_NONNUMERIC,
-        )
-        print(f"Extracted {len(df)} projects total to {OUTPUT_CSV}")
+        _write_output_csv(rows, OUTPUT_CSV)
+        print(f"Extracted {len(rows)} projects total to {OUTPUT_CSV}")
     except OSError as e:
         if e.errno == 13:  # Permission denied
             fallback_csv = SCRIPT_DIR / "output_projects_new.csv"
-            df.to_csv(
-                fallback_csv,
-                index=False,
-                encoding="utf-8-sig",
-                sep=",",
-                na_rep="NULL",
-                quoting=csv.QUOTE_NONNUMERIC,
-            )
-            print(f"Extracted {len(df)} projects total to {fallback_csv}")
+            _write_output_csv(rows, fallback_csv)
+            print(f"Extracted {len(rows)} projects total to {fallback_csv}")
             print("(output_projects.csv is open elsewhere — close it, then rename output_projects_new.csv if needed.)")
         else:
             raise